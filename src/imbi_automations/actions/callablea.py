@@ -1,10 +1,37 @@
 """Callable operations for workflow execution."""
 
 import asyncio
+import functools
+import logging
+import re
 import typing
 
+import pydantic
+
 from imbi_automations import mixins, models, prompts, utils
 
+# The same callable is usually invoked once per project, so the coroutine
+# check is only done the first time it is seen
+_cached_iscoroutinefunction = functools.lru_cache(maxsize=128)(
+    asyncio.iscoroutinefunction
+)
+
+# Detects a leading path scheme and the first Jinja2 delimiter in a single
+# pass; the match always succeeds, with unmatched groups left as None
+_ARG_PATTERN = re.compile(
+    rf'(?P<path>(?:{"|".join(utils.PATH_SCHEMES)})://)?'
+    r'(?:.*?(?P<template>\{[{%#]))?',
+    re.DOTALL,
+)
+
+
+def _is_coroutine_function(func: typing.Callable) -> bool:
+    """Check if func is a coroutine function, caching hashable callables."""
+    try:
+        return _cached_iscoroutinefunction(func)
+    except TypeError:  # Unhashable callable
+        return asyncio.iscoroutinefunction(func)
+
 
 class CallableAction(mixins.WorkflowLoggerMixin):
     """Executes direct method calls on client instances.
@@ -34,18 +61,19 @@ class CallableAction(mixins.WorkflowLoggerMixin):
         callable_name = getattr(
             action.callable, '__name__', repr(action.callable)
         )
-        self.logger.debug(
-            '%s [%s/%s] %s executing callable %s(%r, %r)',
-            self.context.imbi_project.slug,
-            self.context.current_action_index,
-            self.context.total_actions,
-            action.name,
-            callable_name,
-            args,
-            kwargs,
-        )
+        if self.logger.isEnabledFor(logging.DEBUG):  # args may be large
+            self.logger.debug(
+                '%s [%s/%s] %s executing callable %s(%r, %r)',
+                self.context.imbi_project.slug,
+                self.context.current_action_index,
+                self.context.total_actions,
+                action.name,
+                callable_name,
+                args,
+                kwargs,
+            )
         try:
-            if asyncio.iscoroutinefunction(action.callable):
+            if _is_coroutine_function(action.callable):
                 await action.callable(*args, **kwargs)
             else:
                 await asyncio.to_thread(action.callable, *args, **kwargs)
@@ -67,12 +95,20 @@ class CallableAction(mixins.WorkflowLoggerMixin):
         Note: Templates only have access to workflow context variables,
         not other args/kwargs, preventing circular dependencies.
         """
-        # Render template strings first (produces string output)
-        if isinstance(arg, str) and prompts.has_template_syntax(arg):
-            arg = prompts.render(self.context, template=arg)
+        if isinstance(arg, str):
+            match = _ARG_PATTERN.match(arg)
+            has_path_scheme = match['path'] is not None
+            # Render template strings first (produces string output)
+            if match['template'] is not None:
+                arg = prompts.render(self.context, template=arg)
+                has_path_scheme = utils.has_path_scheme(arg)
+        else:  # Only URLs can carry a scheme, skip ints, dicts, etc.
+            has_path_scheme = isinstance(
+                arg, pydantic.AnyUrl
+            ) and utils.has_path_scheme(arg)
 
         # Resolve ResourceUrl paths to filesystem paths
-        if utils.has_path_scheme(arg):
+        if has_path_scheme:
             return utils.resolve_path(self.context, arg)
 
         # Return rendered/processed value (not original input)
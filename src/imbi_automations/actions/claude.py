@@ -5,11 +5,56 @@ prompt templating, failure detection, and restart capabilities for reliable
 AI-powered code transformations.
 """
 
+import asyncio
+import logging
 import pathlib
+import re
 import typing
 
 from imbi_automations import claude, mixins, models, prompts
 
+FAILURE_PATTERNS: dict[str, tuple[str, ...]] = {
+    'dependency_unavailable': (
+        'not found',
+        'could not find',
+        'no matching distribution',
+        'no version found',
+        'not available',
+    ),
+    'constraint_conflict': (
+        'conflict',
+        'incompatible',
+        'requires',
+        'resolution impossible',
+        'cannot install',
+    ),
+    'prohibited_action': (
+        'prohibited',
+        'do not modify',
+        'not allowed',
+        'cannot complete',
+        'constraints prohibit',
+    ),
+    'test_failure': (
+        'test failed',
+        'assertion error',
+        'tests are failing',
+        'exit code',
+    ),
+}
+
+# One pattern per category, checked in table order, so each category is a
+# single scan of the message instead of one per keyword
+_FAILURE_REGEXES: tuple[tuple[str, re.Pattern[str]], ...] = tuple(
+    (category, re.compile('|'.join(map(re.escape, keywords)), re.IGNORECASE))
+    for category, keywords in FAILURE_PATTERNS.items()
+)
+
+PROMPTS_PATH = pathlib.Path(__file__).parent / 'prompts'
+LAST_ERROR_TEMPLATE = PROMPTS_PATH / 'last-error.md.j2'
+PLANNING_WITH_ERRORS_TEMPLATE = PROMPTS_PATH / 'planning-with-errors.md.j2'
+WITH_PLAN_TEMPLATE = PROMPTS_PATH / 'with-plan.md.j2'
+
 
 class ClaudeAction(mixins.WorkflowLoggerMixin):
     """Executes AI-powered code transformations using Claude Code SDK.
@@ -26,7 +71,7 @@ class ClaudeAction(mixins.WorkflowLoggerMixin):
     ) -> None:
         super().__init__(verbose)
         self._set_workflow_logger(context.workflow)
-        self.claude = claude.Claude(configuration, context, verbose)
+        self.claude = claude.get_client(configuration, context, verbose)
         self.configuration = configuration
         self.context = context
         self.has_planning_prompt: bool = False
@@ -41,45 +86,57 @@ class ClaudeAction(mixins.WorkflowLoggerMixin):
             'workflow_name': context.workflow.configuration.name,
             'working_directory': self.context.working_directory,
         }
+        self._agents: tuple[models.ClaudeAgentType, ...] = ()
+        self._prompt_files: dict[models.ClaudeAgentType, pathlib.Path] = {}
+        self._prompt_headers: dict[models.ClaudeAgentType, str] = {}
+        self._prompt_texts: dict[models.ClaudeAgentType, str] = {}
+        self._prompt_action: models.WorkflowClaudeAction | None = None
+        self._prompt_data: dict[str, typing.Any] = {}
 
     async def execute(self, action: models.WorkflowClaudeAction) -> None:
         """Execute the Claude Code action."""
         success = False
         self.last_error = None
-        warning_threshold = int(action.max_cycles * 0.6)
-
-        for cycle in range(1, action.max_cycles + 1):
+        self._prepare_action(action)
+        # Bound once, these are logged several times per cycle
+        slug = self.context.imbi_project.slug
+        index = self.context.current_action_index
+        total = self.context.total_actions
+        max_cycles = action.max_cycles
+        # Only warn on longer runs; a threshold of max_cycles never matches
+        warning_threshold = (
+            int(max_cycles * 0.6) if max_cycles > 5 else max_cycles
+        )
+
+        for cycle in range(1, max_cycles + 1):
             self.logger.debug(
                 '%s [%s/%s] %s Claude Code cycle %d/%d timeout: %s',
-                self.context.imbi_project.slug,
-                self.context.current_action_index,
-                self.context.total_actions,
+                slug,
+                index,
+                total,
                 action.name,
                 cycle,
-                action.max_cycles,
+                max_cycles,
                 action.timeout,
             )
 
             # Warn when approaching max cycles
-            if (
-                warning_threshold <= cycle < action.max_cycles
-                and action.max_cycles > 5
-            ):
+            if warning_threshold <= cycle < max_cycles:
                 self.logger.warning(
                     '%s [%s/%s] %s has used %d/%d cycles - approaching limit',
-                    self.context.imbi_project.slug,
-                    self.context.current_action_index,
-                    self.context.total_actions,
+                    slug,
+                    index,
+                    total,
                     action.name,
                     cycle,
-                    action.max_cycles,
+                    max_cycles,
                 )
 
             try:
                 if await self._execute_cycle(action, cycle):
                     self.logger.debug(
                         '%s %s Claude Code cycle %d successful',
-                        self.context.imbi_project.slug,
+                        slug,
                         action.name,
                         cycle,
                     )
@@ -91,17 +148,33 @@ class ClaudeAction(mixins.WorkflowLoggerMixin):
             except TimeoutError as exc:
                 self.logger.error(
                     '%s [%s/%s] %s timed out in cycle %d/%d: %s',
-                    self.context.imbi_project.slug,
-                    self.context.current_action_index,
-                    self.context.total_actions,
+                    slug,
+                    index,
+                    total,
                     action.name,
                     cycle,
-                    action.max_cycles,
+                    max_cycles,
                     exc,
                 )
                 raise RuntimeError(
                     f'Claude action {action.name} timed out after '
-                    f'{action.timeout} in cycle {cycle}/{action.max_cycles}'
+                    f'{action.timeout} in cycle {cycle}/{max_cycles}'
+                ) from exc
+            except claude.CircuitOpenError as exc:
+                # Upstream is failing, remaining cycles would fail the same
+                self.logger.error(
+                    '%s [%s/%s] %s skipping remaining cycles at %d/%d: %s',
+                    slug,
+                    index,
+                    total,
+                    action.name,
+                    cycle,
+                    max_cycles,
+                    exc,
+                )
+                raise RuntimeError(
+                    f'Claude Code action {action.name} failed in cycle '
+                    f'{cycle}/{max_cycles} (category: circuit_open)'
                 ) from exc
 
         if not success:  # Categorize failure for better diagnostics
@@ -121,6 +194,37 @@ class ClaudeAction(mixins.WorkflowLoggerMixin):
                 )
             raise RuntimeError(error_msg)
 
+    def _prepare_action(self, action: models.WorkflowClaudeAction) -> None:
+        """Build the per-action state reused across cycles.
+
+        The action does not change between cycles, so the agent sequence
+        and template data are only built once instead of for every cycle.
+        """
+        if self._prompt_action is action:
+            return
+        self._prompt_action = action
+        self.has_planning_prompt = bool(action.planning_prompt)
+        workflow_path = self.context.working_directory / 'workflow'
+        self._prompt_files = {}
+        if action.planning_prompt:
+            self._prompt_files[models.ClaudeAgentType.planning] = (
+                workflow_path / action.planning_prompt
+            )
+        self._prompt_files[models.ClaudeAgentType.task] = (
+            workflow_path / action.task_prompt
+        )
+        if action.validation_prompt:
+            self._prompt_files[models.ClaudeAgentType.validation] = (
+                workflow_path / action.validation_prompt
+            )
+        self._agents = tuple(self._prompt_files)
+        self._prompt_texts = {}
+        self._prompt_headers = {}
+        self._prompt_data = {
+            **self.prompt_kwargs,
+            'action': action.model_dump(),
+        }
+
     def _record_commit_context(
         self, action: models.WorkflowClaudeAction, *, skipped: bool
     ) -> None:
@@ -145,38 +249,33 @@ class ClaudeAction(mixins.WorkflowLoggerMixin):
     async def _execute_cycle(
         self, action: models.WorkflowClaudeAction, cycle: int
     ) -> bool:
+        self._prepare_action(action)
+        await self._read_prompt_files()
+
         # Reset per-cycle state
-        self.has_planning_prompt = False
         self.task_plan = None
         self.task_message = None
 
-        # Build agent execution sequence
-        agents = []
-        if action.planning_prompt:
-            agents.append(models.ClaudeAgentType.planning)
-            self.has_planning_prompt = True
-        agents.append(models.ClaudeAgentType.task)
-        if action.validation_prompt:
-            agents.append(models.ClaudeAgentType.validation)
-
-        for agent in agents:
+        for agent in self._agents:
+            agent_label = agent.value  # plain str for log formatting
             self.logger.debug(
                 '%s [%s/%s] %s executing Claude Code %s agent in cycle %d',
                 self.context.imbi_project.slug,
                 self.context.current_action_index,
                 self.context.total_actions,
                 action.name,
-                agent,
+                agent_label,
                 cycle,
             )
 
             prompt = self._get_prompt(action, agent)
-            self.logger.debug(
-                '%s %s execute agent prompt: %s',
-                self.context.imbi_project.slug,
-                action.name,
-                prompt,
-            )
+            if self.logger.isEnabledFor(logging.DEBUG):  # prompts are large
+                self.logger.debug(
+                    '%s %s execute agent prompt: %s',
+                    self.context.imbi_project.slug,
+                    action.name,
+                    prompt,
+                )
 
             # Execute agent query (unified response via MCP tool)
             run = await self.claude.agent_query(prompt, timeout=action.timeout)
@@ -186,7 +285,7 @@ class ClaudeAction(mixins.WorkflowLoggerMixin):
                 self.context.current_action_index,
                 self.context.total_actions,
                 action.name,
-                agent,
+                agent_label,
                 cycle,
             )
             self._log_verbose_info(
@@ -220,25 +319,48 @@ class ClaudeAction(mixins.WorkflowLoggerMixin):
                 # Continue to task agent - don't return yet
             elif run.message is not None:  # Task agent response
                 self.task_message = run.message
-                self.logger.debug(
-                    '%s %s task result: %s',
-                    self.context.imbi_project.slug,
-                    action.name,
-                    run.message,
-                )
+                if self.logger.isEnabledFor(logging.DEBUG):
+                    self.logger.debug(
+                        '%s %s task result: %s',
+                        self.context.imbi_project.slug,
+                        action.name,
+                        run.message,
+                    )
             elif run.validated is not None:  # Validation agent response
-                self.logger.debug(
-                    '%s %s validation result: %r',
-                    self.context.imbi_project.slug,
-                    action.name,
-                    run,
-                )
+                if self.logger.isEnabledFor(logging.DEBUG):
+                    self.logger.debug(
+                        '%s %s validation result: %r',
+                        self.context.imbi_project.slug,
+                        action.name,
+                        run,
+                    )
                 self.task_plan = None
                 self.last_error = run if not run.validated else None
                 return run.validated
 
         return True
 
+    async def _read_prompt_files(self) -> None:
+        """Read the action's prompt files without blocking the event loop.
+
+        The files are read once per action and reused across cycles.
+        """
+        pending = [
+            (agent, path)
+            for agent, path in self._prompt_files.items()
+            if agent not in self._prompt_texts
+        ]
+        if not pending:
+            return
+        texts = await asyncio.gather(
+            *(
+                asyncio.to_thread(path.read_text, encoding='utf-8')
+                for _agent, path in pending
+            )
+        )
+        for (agent, _path), text in zip(pending, texts, strict=True):
+            self._prompt_texts[agent] = text
+
     def _get_prompt(
         self,
         action: models.WorkflowClaudeAction,
@@ -250,55 +372,14 @@ class ClaudeAction(mixins.WorkflowLoggerMixin):
         workflow-specific task prompt. This enables direct execution with
         structured output format instead of spawning a subagent.
         """
-        # Get the agent's system prompt to guide behavior
-        agent_prompt = self.claude.get_agent_prompt(agent)
-        prompt = f'{agent_prompt}\n\n---\n\n# TASK\n\n'
-
-        if agent == models.ClaudeAgentType.planning:
-            prompt_file = (
-                self.context.working_directory
-                / 'workflow'
-                / action.planning_prompt
-            )
-        elif agent == models.ClaudeAgentType.task:
-            prompt_file = (
-                self.context.working_directory
-                / 'workflow'
-                / action.task_prompt
-            )
-        elif agent == models.ClaudeAgentType.validation:
-            prompt_file = (
-                self.context.working_directory
-                / 'workflow'
-                / action.validation_prompt
-            )
-        else:
-            raise RuntimeError(f'Unknown agent: {agent}')
-
-        if prompt_file.suffix == '.j2':
-            data: dict[str, typing.Any] = dict(self.prompt_kwargs)
-            data.update(self.context.model_dump())
-            data.update({'action': action.model_dump()})
-            # Explicitly add context.variables to ensure error handler
-            # context (failed_action, exception, etc.) is available
-            data.update(self.context.variables)
-            for key in {'source', 'destination', 'template'}:
-                if key in data:
-                    del data[key]
-            prompt += prompts.render(self.context, prompt_file, **data)
-        else:
-            prompt += prompt_file.read_text(encoding='utf-8')
+        self._prepare_action(action)
+        prompt = self._get_base_prompt(agent)
 
         if agent == models.ClaudeAgentType.planning and self.last_error:
             # Planning agent with errors: create a new plan, don't fix directly
-            prompt_file = (
-                pathlib.Path(__file__).parent
-                / 'prompts'
-                / 'planning-with-errors.md.j2'
-            )
             return prompts.render(
                 self.context,
-                prompt_file,
+                template=claude.read_asset(PLANNING_WITH_ERRORS_TEMPLATE),
                 last_error=self.last_error.model_dump_json(indent=2),
                 original_prompt=prompt,
             )
@@ -308,28 +389,55 @@ class ClaudeAction(mixins.WorkflowLoggerMixin):
             and self.last_error
         ):
             # Task agent with errors (no planning): fix directly
-            prompt_file = (
-                pathlib.Path(__file__).parent / 'prompts' / 'last-error.md.j2'
-            )
             return prompts.render(
                 self.context,
-                prompt_file,
+                template=claude.read_asset(LAST_ERROR_TEMPLATE),
                 last_error=self.last_error.model_dump_json(indent=2),
                 original_prompt=prompt,
             )
         elif agent == models.ClaudeAgentType.task and self.task_plan:
-            prompt_file = (
-                pathlib.Path(__file__).parent / 'prompts' / 'with-plan.md.j2'
-            )
             return prompts.render(
                 self.context,
-                prompt_file,
+                template=claude.read_asset(WITH_PLAN_TEMPLATE),
                 plan=self.task_plan.model_dump(),
                 original_prompt=prompt,
             )
 
         return prompt
 
+    def _get_base_prompt(self, agent: models.ClaudeAgentType) -> str:
+        """Build the agent's base prompt, before any error or plan wrapper.
+
+        The prompt file is rendered on every call because its template
+        helpers can read the repository, which earlier agents and cycles
+        change. Only the agent header and the file text are reused.
+        """
+        header = self._prompt_headers.get(agent)
+        if header is None:
+            # Get the agent's system prompt to guide behavior
+            agent_prompt = self.claude.get_agent_prompt(agent)
+            header = self._prompt_headers[agent] = (
+                f'{agent_prompt}\n\n---\n\n# TASK\n\n'
+            )
+
+        try:
+            prompt_file = self._prompt_files[agent]
+        except KeyError:
+            raise RuntimeError(f'Unknown agent: {agent}') from None
+        text = self._prompt_texts.get(agent)
+        if text is None:  # Not preloaded by _execute_cycle
+            text = self._prompt_texts[agent] = prompt_file.read_text(
+                encoding='utf-8'
+            )
+
+        if prompt_file.suffix == '.j2':
+            # prompts.render adds context.model_dump() and context.variables
+            # (error handler context such as failed_action, exception, etc.)
+            return header + prompts.render(
+                self.context, template=text, **self._prompt_data
+            )
+        return header + text
+
     def _categorize_failure(self) -> str | None:
         """Categorize the failure type based on last error messages.
 
@@ -341,42 +449,12 @@ class ClaudeAction(mixins.WorkflowLoggerMixin):
             return None
 
         # Combine all error messages for pattern matching
-        error_msg = ' '.join(self.last_error.errors).lower()
-
-        # Define failure patterns and categories
-        failure_patterns = {
-            'dependency_unavailable': [
-                'not found',
-                'could not find',
-                'no matching distribution',
-                'no version found',
-                'not available',
-            ],
-            'constraint_conflict': [
-                'conflict',
-                'incompatible',
-                'requires',
-                'resolution impossible',
-                'cannot install',
-            ],
-            'prohibited_action': [
-                'prohibited',
-                'do not modify',
-                'not allowed',
-                'cannot complete',
-                'constraints prohibit',
-            ],
-            'test_failure': [
-                'test failed',
-                'assertion error',
-                'tests are failing',
-                'exit code',
-            ],
-        }
+        error_msg = ' '.join(self.last_error.errors)
 
-        # Check each category for matches
-        for category, keywords in failure_patterns.items():
-            if any(keyword in error_msg for keyword in keywords):
+        # Categories are checked in FAILURE_PATTERNS order, so a match for
+        # an earlier category wins over any later one
+        for category, pattern in _FAILURE_REGEXES:
+            if pattern.search(error_msg):
                 return category
 
         return 'unknown'
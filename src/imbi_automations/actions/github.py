@@ -1,11 +1,16 @@
 """GitHub operations for workflow execution."""
 
+import asyncio
+import logging
 import typing
 
 import httpx
 
 from imbi_automations import clients, errors, mixins, models
 
+# Upper bound on concurrent GitHub API requests while syncing environments
+MAX_CONCURRENT_REQUESTS = 8
+
 
 class SyncProjectResults(typing.TypedDict):
     success: bool
@@ -79,7 +84,7 @@ class GitHubActions(mixins.WorkflowLoggerMixin):
         )
 
         # Create GitHub client
-        github_client = clients.GitHub(self.configuration)
+        github_client = clients.GitHub.get_instance(config=self.configuration)
 
         # Perform sync
         result = await self._sync_project_environments(
@@ -101,14 +106,16 @@ class GitHubActions(mixins.WorkflowLoggerMixin):
                 len(result['created']),
                 len(result['deleted']),
             )
-            if result['created']:
+            # Only join the environment names when they will be logged
+            debug = self.logger.isEnabledFor(logging.DEBUG)
+            if debug and result['created']:
                 self.logger.debug(
                     '%s %s created environments: %s',
                     self.context.imbi_project.slug,
                     action.name,
                     ', '.join(result['created']),
                 )
-            if result['deleted']:
+            if debug and result['deleted']:
                 self.logger.debug(
                     '%s %s deleted environments: %s',
                     self.context.imbi_project.slug,
@@ -206,6 +213,12 @@ class GitHubActions(mixins.WorkflowLoggerMixin):
             # the unique set of slugs to GitHub.
             imbi_env_set = set(imbi_environments)
             github_env_set = set(github_env_list)
+            if imbi_env_set == github_env_set:
+                self.logger.debug(
+                    'No environment changes required for %s/%s', org, repo
+                )
+                result['success'] = True
+                return result
 
             # Find environments to create/delete and sort for consistency
             environments_to_create = sorted(imbi_env_set - github_env_set)
@@ -219,43 +232,57 @@ class GitHubActions(mixins.WorkflowLoggerMixin):
                 list(environments_to_delete),
             )
 
-            # Delete extra environments from GitHub
-            for env_name in environments_to_delete:
-                result['total_operations'] += 1
-                try:
-                    await github_client.delete_environment(org, repo, env_name)
-                    result['deleted'].append(env_name)
-                    self.logger.info(
-                        'Deleted environment "%s" from %s/%s',
-                        env_name,
-                        org,
-                        repo,
-                    )
-                except httpx.HTTPError as exc:
-                    error_msg = (
-                        f'Failed to delete environment "{env_name}": {exc}'
-                    )
-                    self.logger.error(error_msg)
-                    result['errors'].append(error_msg)
-
-            # Create missing environments in GitHub
-            for env_name in environments_to_create:
-                result['total_operations'] += 1
-                try:
-                    await github_client.create_environment(org, repo, env_name)
-                    result['created'].append(env_name)
-                    self.logger.info(
-                        'Created environment "%s" in %s/%s',
-                        env_name,
-                        org,
-                        repo,
-                    )
-                except httpx.HTTPError as exc:
-                    error_msg = (
-                        f'Failed to create environment "{env_name}": {exc}'
-                    )
-                    self.logger.error(error_msg)
-                    result['errors'].append(error_msg)
+            # Deletes and creates touch distinct environments, so they are
+            # issued concurrently with a bound on in-flight API requests
+            semaphore = asyncio.Semaphore(MAX_CONCURRENT_REQUESTS)
+
+            async def delete(env_name: str) -> str | None:
+                async with semaphore:
+                    try:
+                        await github_client.delete_environment(
+                            org, repo, env_name
+                        )
+                    except httpx.HTTPError as exc:
+                        return (
+                            f'Failed to delete environment "{env_name}": {exc}'
+                        )
+                self.logger.info(
+                    'Deleted environment "%s" from %s/%s', env_name, org, repo
+                )
+                return None
+
+            async def create(env_name: str) -> str | None:
+                async with semaphore:
+                    try:
+                        await github_client.create_environment(
+                            org, repo, env_name
+                        )
+                    except httpx.HTTPError as exc:
+                        return (
+                            f'Failed to create environment "{env_name}": {exc}'
+                        )
+                self.logger.info(
+                    'Created environment "%s" in %s/%s', env_name, org, repo
+                )
+                return None
+
+            deletions, creations = await asyncio.gather(
+                asyncio.gather(*(delete(n) for n in environments_to_delete)),
+                asyncio.gather(*(create(n) for n in environments_to_create)),
+            )
+            result['total_operations'] = len(deletions) + len(creations)
+            for key, env_names, outcomes in (
+                ('deleted', environments_to_delete, deletions),
+                ('created', environments_to_create, creations),
+            ):
+                for env_name, error_msg in zip(
+                    env_names, outcomes, strict=True
+                ):
+                    if error_msg is None:
+                        result[key].append(env_name)
+                    else:
+                        self.logger.error(error_msg)
+                        result['errors'].append(error_msg)
 
             # Determine overall success
             result['success'] = len(result['errors']) == 0
@@ -379,7 +406,7 @@ class GitHubActions(mixins.WorkflowLoggerMixin):
             return
 
         # Create GitHub client
-        github_client = clients.GitHub(self.configuration)
+        github_client = clients.GitHub.get_instance(config=self.configuration)
 
         try:
             await github_client.update_repository(
@@ -214,7 +214,7 @@ class ImbiActions(mixins.WorkflowLoggerMixin):
             self._project_id(),
         )
         try:
-            await self._client().set_project_attribute(
+            updated = await self._client().set_project_attribute(
                 project_id=self._project_id(), name=name, value=action.value
             )
         except (httpx.HTTPError, ValueError) as exc:
@@ -228,6 +228,18 @@ class ImbiActions(mixins.WorkflowLoggerMixin):
                 exc,
             )
             raise
+        if not updated:
+            self.logger.debug(
+                '%s [%s/%s] %s attribute "%s" unchanged on project %s, '
+                'skipped update',
+                self.context.imbi_project.slug,
+                self.context.current_action_index,
+                self.context.total_actions,
+                action.name,
+                name,
+                self._project_id(),
+            )
+            return
         self.logger.info(
             '%s [%s/%s] %s updated attribute "%s" on project %s',
             self.context.imbi_project.slug,
@@ -6,17 +6,21 @@ workflows and direct Anthropic API queries.
 """
 
 import asyncio
+import contextlib
+import functools
 import json
 import logging
 import os
 import pathlib
+import random
 import re
+import time
+import types as pytypes
 import typing
 
-import anthropic
 import claude_agent_sdk
+import httpx
 import pydantic
-from anthropic import types as anthropic_types
 from claude_agent_sdk import types
 
 from imbi_automations import git, mixins, models, prompts, tracker
@@ -24,6 +28,137 @@ from imbi_automations import git, mixins, models, prompts, tracker
 LOGGER = logging.getLogger(__name__)
 BASE_PATH = pathlib.Path(__file__).parent
 COMMIT = 'commit'
+ENV_VAR_PATTERN = re.compile(r'\$\{?([A-Za-z_][A-Za-z0-9_]*)\}?')
+
+# Tools every agent connection may use
+_ALLOWED_TOOLS = (
+    'Bash',
+    'Bash(git:*)',
+    'BashOutput',
+    'Edit',
+    'Glob',
+    'Grep',
+    'KillShell',
+    'MultiEdit',
+    'Read',
+    'Skill',
+    'Task',
+    'Write',
+    'WebFetch',
+    'WebSearch',
+    'SlashCommand',
+    'mcp__agent_tools__submit_agent_response',
+)
+
+# Tool calls are logged by _parse_message, so _log_message skips them
+_TOOL_BLOCKS = (
+    claude_agent_sdk.ToolUseBlock,
+    claude_agent_sdk.ToolResultBlock,
+)
+
+# The shared Anthropic API client and the event loop that created it
+_anthropic: tuple[asyncio.AbstractEventLoop, typing.Any] | None = None
+
+
+@functools.cache
+def read_asset(path: pathlib.Path) -> str:
+    """Read a file shipped with the package once per process."""
+    return path.read_text(encoding='utf-8')
+
+
+@functools.cache
+def _command_files() -> tuple[pathlib.Path, ...]:
+    """Return the packaged Claude Code command files.
+
+    Commands are written flat into the working directory, so only the
+    regular files directly inside the commands directory are used.
+    """
+    try:
+        with os.scandir(BASE_PATH / 'claude-code' / 'commands') as entries:
+            return tuple(
+                pathlib.Path(entry.path)
+                for entry in entries
+                if entry.is_file()
+            )
+    except FileNotFoundError:
+        return ()
+
+
+@functools.cache
+def _load_agent_file(
+    agent_type: models.ClaudeAgentType,
+) -> tuple[typing.Mapping[str, str], str]:
+    """Split a packaged agent file into its frontmatter and prompt template.
+
+    The files are static, so each one is parsed once per process; the
+    prompt is still rendered per workflow context by the caller.
+    """
+    content = read_asset(
+        BASE_PATH / 'claude-code' / 'agents' / f'{agent_type.value}.md.j2'
+    )
+    start = content.find('---')
+    end = content.find('---', start + 3) if start >= 0 else -1
+    if end < 0:
+        raise ValueError(f'Invalid agent file format for {agent_type.value}')
+
+    # Parse frontmatter manually (simple YAML-like format)
+    frontmatter: dict[str, str] = {}
+    for line in content[start + 3 : end].strip().split('\n'):
+        key, sep, value = line.partition(':')
+        if sep:
+            frontmatter[key.strip()] = value.strip()
+
+    # Extract prompt (everything after second ---)
+    return pytypes.MappingProxyType(frontmatter), content[end + 3 :].strip()
+
+
+def _anthropic_client(config: models.AnthropicConfiguration) -> typing.Any:
+    """Return the Anthropic API client shared by every Claude instance.
+
+    A Claude instance is created per project, so sharing the client keeps
+    its connection pool, and the warm TLS connections in it, across the
+    whole run instead of rebuilding both for every project. The pool is
+    bound to the event loop it was created in, so the client is created
+    on first use inside the running loop and replaced if the loop changes.
+    """
+    global _anthropic
+    loop = asyncio.get_running_loop()
+    if _anthropic is not None and _anthropic[0] is loop:
+        return _anthropic[1]
+
+    # Deferred: anthropic takes ~1s to import and is only needed once
+    # a workflow actually talks to Claude
+    import anthropic
+
+    http_client = anthropic.DefaultAsyncHttpxClient(
+        limits=httpx.Limits(
+            max_connections=100,
+            max_keepalive_connections=20,
+            keepalive_expiry=30.0,
+        )
+    )
+    if config.bedrock:
+        client = anthropic.AsyncAnthropicBedrock(http_client=http_client)
+    else:
+        api_key = config.api_key
+        if isinstance(api_key, pydantic.SecretStr):
+            api_key = api_key.get_secret_value()
+        client = anthropic.AsyncAnthropic(
+            api_key=api_key if isinstance(api_key, str) else None,
+            http_client=http_client,
+        )
+    _anthropic = loop, client
+    return client
+
+
+async def close_anthropic_client() -> None:
+    """Close the shared Anthropic API client at the end of a run."""
+    global _anthropic
+    if _anthropic is None:
+        return
+    _loop, client = _anthropic
+    _anthropic = None
+    await client.close()
 
 
 def _expand_env_vars(value: str) -> str:
@@ -42,15 +177,27 @@ def _expand_env_vars(value: str) -> str:
         ValueError: If any referenced environment variable is not set
 
     """
+    if '$' not in value:  # Most config values reference no variables
+        return value
     expanded = os.path.expandvars(value)
     # Check for unexpanded variables (os.path.expandvars leaves them unchanged)
-    remaining = re.findall(r'\$\{?([A-Za-z_][A-Za-z0-9_]*)\}?', expanded)
-    for var in remaining:
-        if var not in os.environ:
-            raise ValueError(f'Environment variable {var} not set')
+    for match in ENV_VAR_PATTERN.finditer(expanded):
+        if match.group(1) not in os.environ:
+            raise ValueError(f'Environment variable {match.group(1)} not set')
     return expanded
 
 
+def _references_env_vars(value: typing.Any) -> bool:
+    """Return True if any string in the value contains a '$'."""
+    if isinstance(value, str):
+        return '$' in value
+    if isinstance(value, list):
+        return any(_references_env_vars(v) for v in value)
+    if isinstance(value, dict):
+        return any(_references_env_vars(v) for v in value.values())
+    return False
+
+
 def _expand_mcp_config(config: dict[str, typing.Any]) -> dict[str, typing.Any]:
     """Recursively expand environment variables in MCP server config.
 
@@ -61,9 +208,12 @@ def _expand_mcp_config(config: dict[str, typing.Any]) -> dict[str, typing.Any]:
         config: MCP server configuration dict from model_dump()
 
     Returns:
-        New dict with all string values expanded
+        New dict with all string values expanded, or the config itself
+        when it references no environment variables
 
     """
+    if not _references_env_vars(config):
+        return config
     result: dict[str, typing.Any] = {}
     for key, value in config.items():
         if isinstance(value, str):
@@ -394,12 +544,14 @@ def _merge_plugin_configs(
 
     """
     # Merge enabled_plugins (workflow overrides main)
-    merged_enabled = {**main_config.enabled_plugins}
-    merged_enabled.update(workflow_config.enabled_plugins)
+    merged_enabled = (
+        main_config.enabled_plugins | workflow_config.enabled_plugins
+    )
 
     # Merge marketplaces (workflow overrides main for same key)
-    merged_marketplaces = {**main_config.marketplaces}
-    merged_marketplaces.update(workflow_config.marketplaces)
+    merged_marketplaces = (
+        main_config.marketplaces | workflow_config.marketplaces
+    )
 
     # Concatenate local plugins (deduplicate by path)
     seen_paths: set[str] = set()
@@ -419,6 +571,98 @@ def _merge_plugin_configs(
 AgentResult = models.ClaudeAgentResponse
 
 
+@functools.cache
+def _agent_response_schema() -> dict[str, typing.Any]:
+    """Return the submit_agent_response input schema, built once.
+
+    Pydantic rebuilds a JSON schema on every model_json_schema() call, and
+    the SDK only reads the schema it is given.
+    """
+    return models.ClaudeAgentResponse.model_json_schema()
+
+
+# Exceptions from Claude Code that indicate a transient upstream problem
+TRANSIENT_ERRORS = (
+    claude_agent_sdk.CLIConnectionError,
+    claude_agent_sdk.ProcessError,
+)
+
+
+class CircuitOpenError(RuntimeError):
+    """Raised when Claude Code queries are short-circuited."""
+
+
+class CircuitBreaker:
+    """Fail fast while Claude Code keeps failing for transient reasons.
+
+    After failure_threshold consecutive failed queries the circuit opens
+    and queries are rejected without starting Claude Code. Once
+    recovery_seconds have passed a single trial query is let through:
+    success closes the circuit, failure opens it again.
+
+    Every Claude instance talks to the same upstream, so a run shares one
+    breaker, built from the [claude] settings by get_instance.
+    """
+
+    _instance: typing.Self | None = None
+
+    def __init__(
+        self, failure_threshold: int = 5, recovery_seconds: float = 30.0
+    ) -> None:
+        self.failure_threshold = failure_threshold
+        self.recovery_seconds = recovery_seconds
+        self.reset()
+
+    @classmethod
+    def get_instance(
+        cls, config: models.ClaudeAgentConfiguration
+    ) -> typing.Self:
+        """Return the run's breaker, creating it on first use."""
+        if cls._instance is None:
+            cls._instance = cls(
+                config.circuit_failure_threshold,
+                config.circuit_recovery_seconds,
+            )
+        return cls._instance
+
+    @property
+    def is_open(self) -> bool:
+        return self._opened_at is not None
+
+    def reset(self) -> None:
+        """Close the circuit and clear the failure count."""
+        self._failures = 0
+        self._opened_at: float | None = None
+        self._trial_in_flight = False
+
+    def before_call(self) -> None:
+        """Raise CircuitOpenError if a query may not be attempted now."""
+        if self._opened_at is None:
+            return
+        remaining = self.recovery_seconds - (
+            time.monotonic() - self._opened_at
+        )
+        if remaining > 0 or self._trial_in_flight:
+            raise CircuitOpenError(
+                f'Claude Code circuit is open after {self._failures} '
+                'consecutive failures'
+            )
+        self._trial_in_flight = True
+
+    def release_trial(self) -> None:
+        """Allow another trial query without recording an outcome."""
+        self._trial_in_flight = False
+
+    def record_success(self) -> None:
+        self.reset()
+
+    def record_failure(self) -> None:
+        self._failures += 1
+        self._trial_in_flight = False
+        if self.is_open or self._failures >= self.failure_threshold:
+            self._opened_at = time.monotonic()
+
+
 class Claude(mixins.WorkflowLoggerMixin):
     """Claude Code client for executing AI-powered code transformations."""
 
@@ -429,16 +673,7 @@ class Claude(mixins.WorkflowLoggerMixin):
         verbose: bool = False,
     ) -> None:
         super().__init__(verbose)
-        if config.anthropic.bedrock:
-            self.anthropic = anthropic.AsyncAnthropicBedrock()
-        else:
-            if isinstance(config.anthropic.api_key, str):
-                api_key = config.anthropic.api_key
-            elif isinstance(config.anthropic.api_key, pydantic.SecretStr):
-                api_key = config.anthropic.api_key.get_secret_value()
-            else:
-                api_key = None
-            self.anthropic = anthropic.AsyncAnthropic(api_key=api_key)
+        self.circuit_breaker = CircuitBreaker.get_instance(config.claude)
         self.agents: Agents = Agents(planning=None, task=None, validation=None)
         self.configuration = config
         self.context = context
@@ -457,6 +692,7 @@ class Claude(mixins.WorkflowLoggerMixin):
         self.tracker = tracker.Tracker.get_instance()
         self._set_workflow_logger(self.context.workflow)
         self._submitted_response: AgentResult | None = None
+        self._agent_tools: types.McpSdkServerConfig | None = None
         self._merged_local_plugins: list[models.ClaudeLocalPlugin] = []
         self._installed_plugin_paths: list[str] = []
         self._plugins_installed = False
@@ -508,13 +744,20 @@ class Claude(mixins.WorkflowLoggerMixin):
         if timeout_seconds is None:
             raise ValueError(f'Invalid timeout format: {timeout}')
 
+        self.circuit_breaker.before_call()
+
         # Execute SDK interaction with timeout wrapper
         try:
             result = await asyncio.wait_for(
-                self._execute_sdk_query(prompt), timeout=timeout_seconds
+                self._execute_sdk_query_with_retry(prompt),
+                timeout=timeout_seconds,
             )
-            return result
+        except TRANSIENT_ERRORS:
+            self.circuit_breaker.record_failure()
+            raise
         except TimeoutError:
+            # The action's own time limit, not a sign Claude Code is down
+            self.circuit_breaker.release_trial()
             # Attempt graceful shutdown
             LOGGER.warning(
                 'Claude Code execution timed out after %s (%ds), '
@@ -523,7 +766,10 @@ class Claude(mixins.WorkflowLoggerMixin):
                 timeout_seconds,
             )
             try:
-                await asyncio.wait_for(self._client.disconnect(), timeout=5)
+                if self._client is not None:
+                    await asyncio.wait_for(
+                        self._client.disconnect(), timeout=5
+                    )
             except TimeoutError:
                 LOGGER.warning(
                     'Claude SDK disconnect failed due to timeout '
@@ -540,6 +786,12 @@ class Claude(mixins.WorkflowLoggerMixin):
                 f'Claude Code execution timed out after {timeout} '
                 f'({timeout_seconds}s)'
             ) from None
+        except BaseException:
+            # Not an upstream failure, let a half-open trial be retried
+            self.circuit_breaker.release_trial()
+            raise
+        self.circuit_breaker.record_success()
+        return result
 
     async def _ensure_plugins_installed(self) -> None:
         """Install Claude marketplaces and plugins if not already done.
@@ -570,9 +822,62 @@ class Claude(mixins.WorkflowLoggerMixin):
             )
             raise
 
+    async def _execute_sdk_query_with_retry(
+        self, prompt: str
+    ) -> AgentResult | None:
+        """Execute the SDK query, retrying transient process failures.
+
+        Connection failures and unexpected CLI process exits are retried
+        with exponential backoff and full jitter, so concurrent projects
+        do not retry in lockstep. A missing CLI and agents that do not
+        submit a response are not retried.
+
+        """
+        max_retries = self.configuration.claude.max_retries
+        base_delay = self.configuration.claude.retry_base_delay
+        for attempt in range(max_retries + 1):
+            try:
+                return await self._execute_sdk_query(prompt)
+            except claude_agent_sdk.CLINotFoundError:
+                raise
+            except TRANSIENT_ERRORS as exc:
+                if attempt == max_retries:
+                    raise
+                delay = random.uniform(0, base_delay * (2**attempt))  # noqa: S311
+                LOGGER.warning(
+                    'Claude Code query failed: %s, retrying in %.1f seconds '
+                    '(attempt %d/%d)',
+                    exc,
+                    delay,
+                    attempt + 1,
+                    max_retries,
+                )
+                if self._client is not None:
+                    with contextlib.suppress(Exception):
+                        await self._client.disconnect()
+                await asyncio.sleep(delay)
+
+        # This should never be reached, but helps with type checking
+        raise RuntimeError('Retry logic failed unexpectedly')
+
+    async def _connect_client(self) -> claude_agent_sdk.ClaudeSDKClient:
+        """Create and connect a new Claude SDK client."""
+        client = self._create_client()
+        try:
+            await client.connect()
+        except BaseException:
+            # Stop a CLI process that was started before connect failed
+            with contextlib.suppress(Exception):
+                await client.disconnect()
+            raise
+        return client
+
     async def _execute_sdk_query(self, prompt: str) -> AgentResult | None:
         """Execute SDK query and capture tool-based response.
 
+        Each query runs in its own Claude Code session so agents do not see
+        each other's conversation.
+
         Args:
             prompt: The prompt to send to the agent
 
@@ -588,11 +893,11 @@ class Claude(mixins.WorkflowLoggerMixin):
         # Install plugins before creating client so we know the paths
         await self._ensure_plugins_installed()
 
-        # Create client lazily after plugins are installed
-        if self._client is None:
-            self._client = self._create_client()
+        # Create client lazily after plugins are installed; the previous
+        # query's client is already disconnected, so drop it first
+        self._client = None
+        self._client = await self._connect_client()
 
-        await self._client.connect()
         await self._client.query(prompt)
         async for message in self._client.receive_response():
             self._parse_message(message)
@@ -676,7 +981,10 @@ class Claude(mixins.WorkflowLoggerMixin):
         self, prompt: str, model: str | None = None
     ) -> str:
         """Use the Anthropic API to run one-off tasks"""
-        message = await self.anthropic.messages.create(
+        from anthropic import types as anthropic_types
+
+        client = _anthropic_client(self.configuration.anthropic)
+        message = await client.messages.create(
             model=model or self.configuration.anthropic.model,
             max_tokens=8192,
             messages=[
@@ -691,15 +999,20 @@ class Claude(mixins.WorkflowLoggerMixin):
         )
         return ''
 
-    def _create_client(self) -> claude_agent_sdk.ClaudeSDKClient:
-        """Create the Claude SDK client using pre-initialized settings."""
-        LOGGER.debug('Claude Code settings: %s', self._settings_path)
+    def _get_agent_tools(self) -> types.McpSdkServerConfig:
+        """Return the agent_tools MCP server, creating it on first use.
+
+        The server only routes tool calls back to this instance, so one is
+        shared by every Claude Code connection this instance makes.
+        """
+        if self._agent_tools is not None:
+            return self._agent_tools
 
         # Create MCP tool for unified agent responses
         @claude_agent_sdk.tool(
             'submit_agent_response',
             'Submit the final agent response (required)',
-            models.ClaudeAgentResponse.model_json_schema(),
+            _agent_response_schema(),
         )
         async def submit_agent_response(
             args: dict[str, typing.Any],
@@ -726,11 +1039,18 @@ class Claude(mixins.WorkflowLoggerMixin):
                 ]
             }
 
-        agent_tools = claude_agent_sdk.create_sdk_mcp_server(
+        self._agent_tools = claude_agent_sdk.create_sdk_mcp_server(
             'agent_tools', '1.0.0', [submit_agent_response]
         )
+        return self._agent_tools
 
-        system_prompt = (BASE_PATH / 'claude-code' / 'CLAUDE.md').read_text()
+    def _create_client(self) -> claude_agent_sdk.ClaudeSDKClient:
+        """Create the Claude SDK client using pre-initialized settings."""
+        LOGGER.debug('Claude Code settings: %s', self._settings_path)
+
+        agent_tools = self._get_agent_tools()
+
+        system_prompt = read_asset(BASE_PATH / 'claude-code' / 'CLAUDE.md')
         if self.context.workflow.configuration.prompt:
             system_prompt += '\n\n---\n\n'
             if isinstance(
@@ -774,24 +1094,7 @@ class Claude(mixins.WorkflowLoggerMixin):
 
         options = claude_agent_sdk.ClaudeAgentOptions(
             agents=dict(self.agents),
-            allowed_tools=[
-                'Bash',
-                'Bash(git:*)',
-                'BashOutput',
-                'Edit',
-                'Glob',
-                'Grep',
-                'KillShell',
-                'MultiEdit',
-                'Read',
-                'Skill',
-                'Task',
-                'Write',
-                'WebFetch',
-                'WebSearch',
-                'SlashCommand',
-                'mcp__agent_tools__submit_agent_response',
-            ],
+            allowed_tools=list(_ALLOWED_TOOLS),
             cwd=self.context.working_directory / 'repository',
             mcp_servers=mcp_servers,
             model=self.configuration.claude.model,
@@ -849,16 +1152,15 @@ class Claude(mixins.WorkflowLoggerMixin):
         commands_dir = claude_dir / 'commands'
         commands_dir.mkdir(parents=True, exist_ok=True)
 
-        for file in (BASE_PATH / 'claude-code' / 'commands').rglob('*'):
+        for file in _command_files():
+            content = read_asset(file)
+            name = file.name
             if file.suffix == '.j2':
                 content = prompts.render(
-                    self.context, file, **self.prompt_kwargs
+                    self.context, template=content, **self.prompt_kwargs
                 )
-            else:
-                content = file.read_text(encoding='utf-8')
-            commands_dir.joinpath(file.name.rstrip('.j2')).write_text(
-                content, encoding='utf-8'
-            )
+                name = file.stem
+            commands_dir.joinpath(name).write_text(content, encoding='utf-8')
 
         output_styles_dir = claude_dir / 'output-style'
         output_styles_dir.mkdir(parents=True, exist_ok=True)
@@ -909,45 +1211,34 @@ class Claude(mixins.WorkflowLoggerMixin):
         self._merged_local_plugins = merged_plugins.local_plugins
 
         # Add git configuration if signing is enabled
-        if self.configuration.git.gpg_sign:
+        git_settings = self.configuration.git
+        if git_settings.gpg_sign:
             git_config: dict[str, typing.Any] = {'commit': {'gpgsign': True}}
+            gpg_config: dict[str, typing.Any] = {}
 
             # Add format specification (required for SSH signing)
-            if self.configuration.git.gpg_format:
-                git_config['gpg'] = {
-                    'format': self.configuration.git.gpg_format
-                }
+            if git_settings.gpg_format:
+                gpg_config['format'] = git_settings.gpg_format
 
             # Add signing key
-            if self.configuration.git.signing_key:
-                git_config['user'] = {
-                    'signingkey': self.configuration.git.signing_key
-                }
+            if git_settings.signing_key:
+                git_config['user'] = {'signingkey': git_settings.signing_key}
 
             # Add SSH program (for SSH signing with 1Password, etc.)
-            if self.configuration.git.ssh_program:
-                if 'gpg' not in git_config:
-                    git_config['gpg'] = {}
-                git_config['gpg']['ssh'] = {
-                    'program': self.configuration.git.ssh_program
-                }
+            if git_settings.ssh_program:
+                gpg_config['ssh'] = {'program': git_settings.ssh_program}
 
             # Add GPG program (for traditional GPG signing)
-            if self.configuration.git.gpg_program:
-                if 'gpg' not in git_config:
-                    git_config['gpg'] = {}
-                git_config['gpg']['program'] = (
-                    self.configuration.git.gpg_program
-                )
+            if git_settings.gpg_program:
+                gpg_config['program'] = git_settings.gpg_program
 
+            if gpg_config:
+                git_config['gpg'] = gpg_config
             settings_config['git'] = git_config
 
-        settings.write_text(
-            json.dumps(settings_config, indent=2), encoding='utf-8'
-        )
-
-        with settings.open('r', encoding='utf-8') as f:
-            LOGGER.debug('Claude Code settings: %s', f.read())
+        settings_json = json.dumps(settings_config, indent=2)
+        settings.write_text(settings_json, encoding='utf-8')
+        LOGGER.debug('Claude Code settings: %s', settings_json)
 
         return settings
 
@@ -965,40 +1256,29 @@ class Claude(mixins.WorkflowLoggerMixin):
     ) -> None:
         """Log the message from Claude Code passed in as a dataclass."""
         if isinstance(content, list):
+            # Skip trimming message text that would not be logged
+            debug = self.logger.isEnabledFor(logging.DEBUG)
             for entry in content:
-                if isinstance(
-                    entry,
-                    claude_agent_sdk.ToolUseBlock
-                    | claude_agent_sdk.ToolResultBlock,
-                ):
+                if isinstance(entry, _TOOL_BLOCKS):
                     continue
                 elif isinstance(entry, claude_agent_sdk.TextBlock):
-                    self.logger.debug(
-                        '[%s] %s: %s',
-                        self.context.imbi_project.slug,
-                        message_type,
-                        entry.text.rstrip(':'),
-                    )
+                    if debug:
+                        self.logger.debug(
+                            '[%s] %s: %s',
+                            self.context.imbi_project.slug,
+                            message_type,
+                            entry.text.rstrip(':'),
+                        )
                 elif isinstance(entry, claude_agent_sdk.ThinkingBlock):
-                    self.logger.debug(
-                        '[%s] %s: [thinking] %s',
-                        self.context.imbi_project.slug,
-                        message_type,
-                        entry.thinking[:100] + '...'
-                        if len(entry.thinking) > 100
-                        else entry.thinking,
-                    )
-                elif isinstance(
-                    entry,
-                    claude_agent_sdk.ToolUseBlock
-                    | claude_agent_sdk.ToolResultBlock,
-                ):
-                    self.logger.debug(
-                        '[%s] %s: %r',
-                        self.context.imbi_project.slug,
-                        message_type,
-                        entry,
-                    )
+                    if debug:
+                        self.logger.debug(
+                            '[%s] %s: [thinking] %s',
+                            self.context.imbi_project.slug,
+                            message_type,
+                            entry.thinking[:100] + '...'
+                            if len(entry.thinking) > 100
+                            else entry.thinking,
+                        )
                 else:
                     raise RuntimeError(f'Unknown message type: {type(entry)}')
         else:
@@ -1023,31 +1303,11 @@ class Claude(mixins.WorkflowLoggerMixin):
         ---
         Prompt content here...
         """
-        agent_file = (
-            BASE_PATH / 'claude-code' / 'agents' / f'{agent_type.value}.md.j2'
-        )
-        content = agent_file.read_text(encoding='utf-8')
-
-        # Split frontmatter and prompt content
-        parts = content.split('---', 2)
-        if len(parts) < 3:
-            raise ValueError(
-                f'Invalid agent file format for {agent_type.value}'
-            )
-
-        # Parse frontmatter manually (simple YAML-like format)
-        frontmatter = {}
-        for line in parts[1].strip().split('\n'):
-            if ':' in line:
-                key, value = line.split(':', 1)
-                frontmatter[key.strip()] = value.strip()
-
-        # Extract prompt (everything after second ---)
-        prompt = parts[2].strip()
+        frontmatter, prompt = _load_agent_file(agent_type)
 
         # Parse tools (comma-separated string to list)
         tools_str = frontmatter.get('tools', '')
-        tools = [t.strip() for t in tools_str.split(',')] if tools_str else []
+        tools = [t.strip() for t in tools_str.split(',') if t.strip()]
 
         return types.AgentDefinition(
             description=frontmatter.get('description', ''),
@@ -1088,3 +1348,24 @@ class Claude(mixins.WorkflowLoggerMixin):
                 LOGGER.debug(
                     'Result (%s): %r', message.session_id, message.result
                 )
+
+
+def get_client(
+    configuration: models.Configuration,
+    context: models.WorkflowContext,
+    verbose: bool = False,
+) -> Claude:
+    """Return the context's Claude client, creating it on first use.
+
+    Claude actions and AI commits for a project share one client so the
+    working directory, agents, and plugins are only set up once per project.
+    """
+    client = context._claude
+    if (
+        client is None
+        or client.context is not context  # model_copy() of the context
+        or client.configuration is not configuration
+    ):
+        client = Claude(configuration, context, verbose)
+        context._claude = client
+    return client
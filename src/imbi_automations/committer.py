@@ -62,7 +62,7 @@ class Committer(mixins.WorkflowLoggerMixin):
             context.total_actions,
             action.name,
         )
-        client = claude.Claude(self.configuration, context, self.verbose)
+        client = claude.get_client(self.configuration, context, self.verbose)
 
         # Build the commit prompt from the command template
         commit_template = BASE_PATH / 'prompts' / 'commit.md.j2'
@@ -18,6 +18,7 @@ import tempfile
 import async_lru
 
 from imbi_automations import (
+    claude,
     clients,
     git,
     imc,
@@ -117,6 +118,13 @@ class Automation(mixins.WorkflowLoggerMixin):
             raise ValueError('No valid target argument provided')
 
     async def run(self) -> bool:
+        try:
+            return await self._run()
+        finally:
+            # Its connection pool is bound to this run's event loop
+            await claude.close_anthropic_client()
+
+    async def _run(self) -> bool:
         # Initialize Imbi metadata cache
         cache_file = self.configuration.cache_dir / 'metadata.json'
         await self.registry.refresh_from_cache(
@@ -48,6 +48,10 @@ class ImbiMetadataCache:
         self.cache_file: pathlib.Path | None = None
         self.config: configuration.ImbiConfiguration | None = None
         self.imbi_client: clients.Imbi | None = None
+        # (environments list the index was built from, slug-or-name → slug)
+        self._environment_index: tuple[
+            list[imbi.ImbiEnvironment] | None, dict[str, str]
+        ] = (None, {})
 
     def is_cache_expired(self) -> bool:
         """Return True if the cache has aged past the TTL."""
@@ -95,21 +99,30 @@ class ImbiMetadataCache:
             ValueError: If any environment is not found in the cache.
 
         """
+        index = self._environment_slug_index()
         result: list[str] = []
         for value in values:
-            env = next(
-                (
-                    e
-                    for e in self.cache_data.environments
-                    if e.slug == value or e.name == value
-                ),
-                None,
-            )
-            if not env:
+            slug = index.get(value)
+            if slug is None:
                 raise ValueError(f'Environment not found in cache: {value}')
-            result.append(env.slug)
+            result.append(slug)
         return result
 
+    def _environment_slug_index(self) -> dict[str, str]:
+        """Return the slug-or-name to slug map for the cached environments.
+
+        The map is rebuilt whenever the environments list is replaced, and
+        the first environment matching a value wins, as in a linear scan.
+        """
+        environments = self.cache_data.environments
+        if self._environment_index[0] is not environments:
+            index: dict[str, str] = {}
+            for env in environments:
+                index.setdefault(env.slug, env.slug)
+                index.setdefault(env.name, env.slug)
+            self._environment_index = (environments, index)
+        return self._environment_index[1]
+
     async def refresh_from_cache(
         self, cache_file: pathlib.Path, config: configuration.ImbiConfiguration
     ) -> None:
@@ -77,6 +77,12 @@ class ClaudeAgentConfiguration(pydantic_settings.BaseSettings):
     plugins: claude_models.ClaudePluginConfig = pydantic.Field(
         default_factory=claude_models.ClaudePluginConfig
     )
+    # Retries for transient Claude Code process/connection failures
+    max_retries: int = pydantic.Field(default=3, ge=0)
+    retry_base_delay: float = pydantic.Field(default=1.0, ge=0)
+    # Consecutive transient failures before agent queries fail fast
+    circuit_failure_threshold: int = pydantic.Field(default=5, ge=1)
+    circuit_recovery_seconds: float = pydantic.Field(default=30.0, ge=0)
 
     def __init__(self, **kwargs: typing.Any) -> None:
         super().__init__(**kwargs)
@@ -976,3 +976,8 @@ class WorkflowContext(pydantic.BaseModel):
 
     # Custom variables set by actions (e.g., get_project_fact)
     variables: dict[str, typing.Any] = {}
+
+    # Claude client shared by the context's Claude actions and AI commits
+    # (claude.Claude, avoid circular import); private so it is not dumped
+    # into templates
+    _claude: typing.Any = pydantic.PrivateAttr(default=None)
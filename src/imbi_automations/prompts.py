@@ -5,11 +5,13 @@ messages, commit messages, and other dynamic content using Jinja2 with full
 workflow context support.
 """
 
+import functools
 import json
 import logging
 import pathlib
 import re
 import tomllib
+import types
 import typing
 from urllib import parse
 
@@ -21,6 +23,33 @@ from imbi_automations import models, utils
 
 LOGGER = logging.getLogger(__name__)
 
+_ENVIRONMENT = jinja2.Environment(
+    autoescape=False,  # noqa: S701
+    undefined=jinja2.StrictUndefined,
+)
+
+
+@functools.lru_cache(maxsize=128)
+def _compile(template: str) -> types.CodeType:
+    """Compile template source, caching the result per source string.
+
+    Prompt templates are rendered repeatedly (once per agent per cycle), so
+    caching the compiled code skips Jinja2's lex/parse/compile on every call
+    after the first.
+    """
+    return _ENVIRONMENT.compile(template)
+
+
+def _from_string(
+    template: str, template_globals: dict[str, typing.Any] | None = None
+) -> jinja2.Template:
+    """Return a template for the source using the shared environment."""
+    return _ENVIRONMENT.template_class.from_code(
+        _ENVIRONMENT,
+        _compile(template),
+        _ENVIRONMENT.make_globals(template_globals),
+    )
+
 
 def render(
     context: models.WorkflowContext | None = None,
@@ -51,12 +80,9 @@ def render(
     if source and not isinstance(source, pathlib.Path):
         raise RuntimeError(f'source is not a Path object: {type(source)}')
 
-    env = jinja2.Environment(
-        autoescape=False,  # noqa: S701
-        undefined=jinja2.StrictUndefined,
-    )
+    template_globals: dict[str, typing.Any] = {}
     if context:
-        env.globals.update(
+        template_globals.update(
             {
                 'compare_semver': compare_semver,
                 'extract_image_from_dockerfile': (
@@ -92,7 +118,7 @@ def render(
 
     if isinstance(source, pathlib.Path) and not template:
         template = source.read_text(encoding='utf-8')
-    return env.from_string(template).render(**kwargs)
+    return _from_string(template, template_globals).render(**kwargs)
 
 
 def render_file(
@@ -125,14 +151,19 @@ def render_path(
     return path
 
 
+_TEMPLATE_MARKERS = (
+    '{{',  # Variable substitution
+    '{%',  # Control structures
+    '{#',  # Comments
+)
+
+
 def has_template_syntax(value: str) -> bool:
     """Check if value contains Jinja2 templating syntax."""
-    template_patterns = [
-        '{{',  # Variable substitution
-        '{%',  # Control structures
-        '{#',  # Comments
-    ]
-    return any(pattern in value for pattern in template_patterns)
+    # Every marker starts with '{', so plain strings need a single scan
+    return '{' in value and any(
+        marker in value for marker in _TEMPLATE_MARKERS
+    )
 
 
 def render_template_string(template_string: str, **kwargs: typing.Any) -> str:
@@ -145,10 +176,7 @@ def render_template_string(template_string: str, **kwargs: typing.Any) -> str:
     Returns:
         Rendered string.
     """
-    env = jinja2.Environment(
-        autoescape=False,  # noqa: S701
-        undefined=jinja2.StrictUndefined,
-    )
+    template_globals: dict[str, typing.Any] = {}
 
     # Add context if workflow context is provided
     if 'workflow' in kwargs:
@@ -159,7 +187,7 @@ def render_template_string(template_string: str, **kwargs: typing.Any) -> str:
             working_directory=kwargs.get('working_directory'),
             starting_commit=kwargs.get('starting_commit'),
         )
-        env.globals.update(
+        template_globals.update(
             {
                 'read_file': (
                     lambda path: utils.resolve_path(context, path).read_text(
@@ -169,15 +197,25 @@ def render_template_string(template_string: str, **kwargs: typing.Any) -> str:
             }
         )
 
-    return env.from_string(template_string).render(**kwargs)
+    return _from_string(template_string, template_globals).render(**kwargs)
+
+
+_VERSION_PREFIX = re.compile(r'^[v\^~>=<]+')
+# major[.minor[.patch[-build]]] without leading zeros, as semver requires
+_NUMERIC_VERSION = re.compile(
+    r'(0|[1-9]\d*)(?:\.(0|[1-9]\d*)(?:\.(0|[1-9]\d*)(?:-(\d+))?)?)?', re.ASCII
+)
 
 
+@functools.lru_cache(maxsize=4096)
 def _parse_version_with_build(
     version: str,
 ) -> tuple[semver.Version, int | None]:
     """Parse a version string, extracting optional build number.
 
     Handles versions like "3.9.18-4" where -4 is a build/revision number.
+    Results are cached since the same versions are compared across many
+    projects, and semver.Version instances are immutable.
 
     Args:
         version: Version string to parse.
@@ -186,7 +224,16 @@ def _parse_version_with_build(
         Tuple of (semver.Version, optional build number).
     """
     # Clean version string (remove prefixes like v, ^, ~, >=, etc.)
-    cleaned = re.sub(r'^[v\^~>=<]+', '', version.strip())
+    cleaned = _VERSION_PREFIX.sub('', version.strip())
+
+    # Plain numeric versions are built directly, skipping semver's parser
+    numeric_match = _NUMERIC_VERSION.fullmatch(cleaned)
+    if numeric_match:
+        major, minor, patch, build = numeric_match.groups()
+        return (
+            semver.Version(int(major), int(minor or 0), int(patch or 0)),
+            int(build) if build is not None else None,
+        )
 
     # Check for build number suffix (e.g., "3.9.18-4")
     build_match = re.match(r'^(\d+\.\d+\.\d+)-(\d+)$', cleaned)
@@ -221,10 +268,15 @@ def _compare_versions(
     Returns:
         -1 if current < target, 0 if equal, 1 if current > target.
     """
-    if current < target:
-        return -1
-    elif current > target:
-        return 1
+    if current.prerelease is None and target.prerelease is None:
+        # Release versions order by their numeric fields alone
+        current_key = (current.major, current.minor, current.patch)
+        target_key = (target.major, target.minor, target.patch)
+        order = (current_key > target_key) - (current_key < target_key)
+    else:
+        order = current.compare(target)
+    if order:
+        return order
 
     # Versions equal, compare build numbers if present
     if current_build is not None and target_build is not None:
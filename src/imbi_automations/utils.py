@@ -215,17 +215,14 @@ def extract_package_name_from_pyproject(
         raise RuntimeError(f'Failed to extract package name: {err}') from err
 
 
+PATH_SCHEMES = ('external', 'extracted', 'file', 'repository', 'workflow')
+
+_PATH_SCHEME_PREFIXES = tuple(f'{scheme}://' for scheme in PATH_SCHEMES)
+
+
 def has_path_scheme(path: models.ResourceUrl | pathlib.Path | str) -> bool:
     """Check if a path has a scheme."""
-    return str(path).startswith(
-        (
-            'external://',
-            'extracted://',
-            'file://',
-            'repository://',
-            'workflow://',
-        )
-    )
+    return str(path).startswith(_PATH_SCHEME_PREFIXES)
 
 
 def load_toml(toml_file: typing.TextIO) -> dict:
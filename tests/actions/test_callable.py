@@ -532,6 +532,23 @@ class CallableActionTestCase(base.AsyncTestCase):
         # Should await properly
         await self.callable_executor.execute(action)
 
+    async def test_asyncio_detection_is_cached(self) -> None:
+        """Test that the coroutine check is only done once per callable."""
+        callablea._cached_iscoroutinefunction.cache_clear()
+        action = models.WorkflowCallableAction(
+            name='test-cached-detection',
+            type='callable',
+            callable=async_function,
+            args=[1, 'test'],
+        )
+
+        await self.callable_executor.execute(action)
+        await self.callable_executor.execute(action)
+
+        info = callablea._cached_iscoroutinefunction.cache_info()
+        self.assertEqual(info.misses, 1)
+        self.assertEqual(info.hits, 1)
+
     async def test_execute_with_resourceurl_args(self) -> None:
         """Test execution with ResourceUrl arguments that get resolved."""
         mock_callable = mock.Mock(return_value='success')
@@ -560,6 +577,25 @@ class CallableActionTestCase(base.AsyncTestCase):
         self.assertEqual(call_args[0], repo_dir / 'config.yaml')
         self.assertEqual(call_args[1], 'literal-string')
 
+    async def test_execute_with_templated_path_string(self) -> None:
+        """Test that templated strings with a path scheme are resolved."""
+        mock_callable = mock.Mock(return_value='success')
+
+        action = models.WorkflowCallableAction(
+            name='test-templated-path',
+            type='callable',
+            callable=mock_callable,
+            args=['repository:///{{ imbi_project.slug }}.yaml'],
+        )
+
+        await self.callable_executor.execute(action)
+
+        call_args = mock_callable.call_args[0]
+        self.assertEqual(
+            call_args[0],
+            self.working_directory / 'repository' / 'test-project.yaml',
+        )
+
     async def test_execute_with_resourceurl_kwargs(self) -> None:
         """Test execution with ResourceUrl in keyword arguments."""
         mock_callable = mock.Mock(return_value='success')
@@ -2,6 +2,7 @@
 
 import pathlib
 import tempfile
+import typing
 import unittest
 from unittest import mock
 
@@ -69,6 +70,30 @@ class ClaudeActionTestCase(base.AsyncTestCase):
         super().tearDown()
         self.temp_dir.cleanup()
 
+    def test_claude_client_shared_per_context(self) -> None:
+        """Test Claude actions for the same context share one client."""
+        with (
+            mock.patch('claude_agent_sdk.ClaudeSDKClient'),
+            mock.patch(
+                'builtins.open',
+                new_callable=mock.mock_open,
+                read_data='Mock system prompt',
+            ),
+        ):
+            first = claude.ClaudeAction(
+                self.config, self.context, verbose=True
+            )
+            second = claude.ClaudeAction(
+                self.config, self.context, verbose=True
+            )
+            other = claude.ClaudeAction(
+                self.config, self.context.model_copy(), verbose=True
+            )
+
+        self.assertIs(first.claude, second.claude)
+        self.assertIsNot(first.claude, other.claude)
+        self.assertNotIn('_claude', self.context.model_dump())
+
     def test_get_prompt_task_with_jinja2(self) -> None:
         """Test _get_prompt method for task agent with Jinja2 template."""
         with (
@@ -107,10 +132,58 @@ class ClaudeActionTestCase(base.AsyncTestCase):
             prompt = claude_action._get_prompt(
                 action, models.ClaudeAgentType.task
             )
+            # Later cycles render again so the helpers see current files
+            self.assertEqual(
+                claude_action._get_prompt(action, models.ClaudeAgentType.task),
+                prompt,
+            )
 
         self.assertIn('TASK AGENT', prompt)
         self.assertIn('Hello test-project!', prompt)
-        mock_render.assert_called_once()
+        self.assertEqual(mock_render.call_count, 2)
+        # Context data is merged by prompts.render, not copied in here
+        self.assertEqual(
+            set(mock_render.call_args.kwargs),
+            {*claude_action.prompt_kwargs, 'action', 'template'},
+        )
+
+    def test_get_prompt_renders_current_repository_each_cycle(self) -> None:
+        """Test later cycles see repository changes in file helpers."""
+        with (
+            mock.patch('claude_agent_sdk.ClaudeSDKClient'),
+            mock.patch(
+                'builtins.open',
+                new_callable=mock.mock_open,
+                read_data='Mock system prompt',
+            ),
+        ):
+            claude_action = claude.ClaudeAction(
+                self.config, self.context, verbose=True
+            )
+
+        action = models.WorkflowClaudeAction(
+            name='test-action', type='claude', task_prompt='test-prompt.j2'
+        )
+        (self.working_directory / 'workflow' / 'test-prompt.j2').write_text(
+            "Version {{ read_file('repository:///VERSION') }}"
+        )
+        version_file = self.working_directory / 'repository' / 'VERSION'
+
+        with mock.patch.object(
+            claude_action.claude, 'get_agent_prompt', return_value='# TASK'
+        ) as get_agent_prompt:
+            version_file.write_text('1.0.0')
+            first = claude_action._get_prompt(
+                action, models.ClaudeAgentType.task
+            )
+            version_file.write_text('2.0.0')
+            second = claude_action._get_prompt(
+                action, models.ClaudeAgentType.task
+            )
+
+        self.assertIn('Version 1.0.0', first)
+        self.assertIn('Version 2.0.0', second)
+        get_agent_prompt.assert_called_once()
 
     def test_get_prompt_validator_with_plain_text(self) -> None:
         """Test _get_prompt method for validator agent with plain text."""
@@ -199,6 +272,60 @@ class ClaudeActionTestCase(base.AsyncTestCase):
         self.assertTrue(result)
         self.assertEqual(mock_agent_query.call_count, 2)  # task + validator
 
+    @mock.patch('imbi_automations.claude.Claude.agent_query')
+    @mock.patch('imbi_automations.claude.Claude.get_agent_prompt')
+    async def test_execute_cycle_validation_prompt_sees_task_edits(
+        self,
+        mock_get_agent_prompt: mock.Mock,
+        mock_agent_query: mock.AsyncMock,
+    ) -> None:
+        """Test the validation prompt is rendered after the task agent."""
+        mock_get_agent_prompt.return_value = '# AGENT\n\nDo the work.'
+
+        with (
+            mock.patch('claude_agent_sdk.ClaudeSDKClient'),
+            mock.patch(
+                'builtins.open',
+                new_callable=mock.mock_open,
+                read_data='Mock system prompt',
+            ),
+        ):
+            claude_action = claude.ClaudeAction(
+                self.config, self.context, verbose=True
+            )
+
+        version_file = self.working_directory / 'repository' / 'VERSION'
+        version_file.write_text('1.0.0')
+        validation_prompts: list[str] = []
+
+        async def agent_query(
+            prompt: str, **kwargs: typing.Any
+        ) -> models.ClaudeAgentResponse:
+            if 'Task prompt' in prompt:
+                version_file.write_text('2.0.0')
+                return models.ClaudeAgentResponse(message='Success')
+            validation_prompts.append(prompt)
+            return models.ClaudeAgentResponse(validated=True, errors=[])
+
+        mock_agent_query.side_effect = agent_query
+
+        action = models.WorkflowClaudeAction(
+            name='test-action',
+            type='claude',
+            task_prompt='test-prompt.md',
+            validation_prompt='test-validation.md.j2',
+        )
+        (self.working_directory / 'workflow' / 'test-prompt.md').write_text(
+            'Task prompt'
+        )
+        (
+            self.working_directory / 'workflow' / 'test-validation.md.j2'
+        ).write_text("Version {{ read_file('repository:///VERSION') }}")
+
+        self.assertTrue(await claude_action._execute_cycle(action, cycle=1))
+        self.assertEqual(len(validation_prompts), 1)
+        self.assertIn('Version 2.0.0', validation_prompts[0])
+
     @mock.patch('imbi_automations.claude.Claude.agent_query')
     @mock.patch('imbi_automations.claude.Claude.get_agent_prompt')
     async def test_execute_cycle_validation_failure(
@@ -245,6 +372,45 @@ class ClaudeActionTestCase(base.AsyncTestCase):
         self.assertFalse(result)
         self.assertEqual(mock_agent_query.call_count, 2)  # task + validation
 
+    @mock.patch('imbi_automations.claude.Claude.agent_query')
+    @mock.patch('imbi_automations.claude.Claude.get_agent_prompt')
+    async def test_execute_cycle_reads_prompt_files_once(
+        self,
+        mock_get_agent_prompt: mock.Mock,
+        mock_agent_query: mock.AsyncMock,
+    ) -> None:
+        """Test prompt files are read once and reused across cycles."""
+        mock_agent_query.return_value = models.ClaudeAgentResponse(
+            message='Task completed'
+        )
+        mock_get_agent_prompt.return_value = '# AGENT\n\nDo the work.'
+
+        with (
+            mock.patch('claude_agent_sdk.ClaudeSDKClient'),
+            mock.patch(
+                'builtins.open',
+                new_callable=mock.mock_open,
+                read_data='Mock system prompt',
+            ),
+        ):
+            claude_action = claude.ClaudeAction(
+                self.config, self.context, verbose=True
+            )
+
+        action = models.WorkflowClaudeAction(
+            name='test-action', type='claude', task_prompt='test-prompt.md'
+        )
+        prompt_file = self.working_directory / 'workflow' / 'test-prompt.md'
+        prompt_file.write_text('Task prompt')
+
+        await claude_action._execute_cycle(action, cycle=1)
+        prompt_file.write_text('Changed prompt')
+        await claude_action._execute_cycle(action, cycle=2)
+
+        prompt = mock_agent_query.call_args.args[0]
+        self.assertIn('Task prompt', prompt)
+        self.assertNotIn('Changed prompt', prompt)
+
     @mock.patch('imbi_automations.claude.Claude.agent_query')
     @mock.patch('imbi_automations.claude.Claude.get_agent_prompt')
     async def test_execute_all_cycles_success(
@@ -287,6 +453,45 @@ class ClaudeActionTestCase(base.AsyncTestCase):
         # Should only call once since first cycle succeeds
         mock_agent_query.assert_called_once()
 
+    @mock.patch('imbi_automations.claude.Claude.agent_query')
+    @mock.patch('imbi_automations.claude.Claude.get_agent_prompt')
+    async def test_execute_circuit_open_skips_cycles(
+        self,
+        mock_get_agent_prompt: mock.Mock,
+        mock_agent_query: mock.AsyncMock,
+    ) -> None:
+        """Test execute stops cycling when the Claude circuit is open."""
+        mock_agent_query.side_effect = claude.claude.CircuitOpenError('open')
+        mock_get_agent_prompt.return_value = '# AGENT\n\nDo the work.'
+
+        with (
+            mock.patch('claude_agent_sdk.ClaudeSDKClient'),
+            mock.patch(
+                'builtins.open',
+                new_callable=mock.mock_open,
+                read_data='Mock system prompt',
+            ),
+        ):
+            claude_action = claude.ClaudeAction(
+                self.config, self.context, verbose=True
+            )
+
+        action = models.WorkflowClaudeAction(
+            name='test-action',
+            type='claude',
+            task_prompt='test-prompt.md',
+            max_cycles=3,
+        )
+        (self.working_directory / 'workflow' / 'test-prompt.md').write_text(
+            'Task prompt'
+        )
+
+        with self.assertRaises(RuntimeError) as exc_context:
+            await claude_action.execute(action)
+
+        self.assertIn('circuit_open', str(exc_context.exception))
+        mock_agent_query.assert_called_once()
+
     @mock.patch('imbi_automations.claude.Claude.agent_query')
     @mock.patch('imbi_automations.claude.Claude.get_agent_prompt')
     async def test_execute_all_cycles_fail(
@@ -395,6 +600,49 @@ class ClaudeActionTestCase(base.AsyncTestCase):
             mock_agent_query.call_count, 4
         )  # 2 cycles * (task + validation)
 
+    def _categorize(self, *errors: str) -> str | None:
+        with (
+            mock.patch('claude_agent_sdk.ClaudeSDKClient'),
+            mock.patch(
+                'builtins.open',
+                new_callable=mock.mock_open,
+                read_data='Mock system prompt',
+            ),
+        ):
+            claude_action = claude.ClaudeAction(
+                self.config, self.context, verbose=False
+            )
+        claude_action.last_error = models.ClaudeAgentResponse(
+            validated=False, errors=list(errors)
+        )
+        return claude_action._categorize_failure()
+
+    def test_categorize_failure_no_errors(self) -> None:
+        """No category is returned when there are no errors."""
+        self.assertIsNone(self._categorize())
+
+    def test_categorize_failure_matches_category(self) -> None:
+        """Keywords are matched case-insensitively to their category."""
+        self.assertEqual(
+            self._categorize('Tests are failing with Assertion Error'),
+            'test_failure',
+        )
+        self.assertEqual(
+            self._categorize('Version conflict detected'),
+            'constraint_conflict',
+        )
+
+    def test_categorize_failure_category_priority(self) -> None:
+        """Earlier categories win even when matched later in the text."""
+        self.assertEqual(
+            self._categorize('Change is prohibited', 'package not found'),
+            'dependency_unavailable',
+        )
+
+    def test_categorize_failure_unknown(self) -> None:
+        """Unmatched errors are categorized as unknown."""
+        self.assertEqual(self._categorize('Something odd'), 'unknown')
+
 
 # GetResponseModelTestCase removed - _get_response_model function no longer
 # exists with unified ClaudeAgentResponse model
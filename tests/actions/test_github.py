@@ -1,5 +1,6 @@
 """Tests for GitHub actions."""
 
+import asyncio
 import pathlib
 import tempfile
 from unittest import mock
@@ -111,9 +112,9 @@ class GitHubActionsTestCase(base.AsyncTestCase):
         )
         mock_github_client.delete_environment.return_value = True
 
-        # Patch GitHub client constructor
+        # Patch the shared GitHub client
         with mock.patch(
-            'imbi_automations.actions.github.clients.GitHub',
+            'imbi_automations.actions.github.clients.GitHub.get_instance',
             return_value=mock_github_client,
         ):
             await self.github_actions.execute(action)
@@ -173,7 +174,7 @@ class GitHubActionsTestCase(base.AsyncTestCase):
         ]
 
         with mock.patch(
-            'imbi_automations.actions.github.clients.GitHub',
+            'imbi_automations.actions.github.clients.GitHub.get_instance',
             return_value=mock_github_client,
         ):
             await github_actions_no_envs.execute(action)
@@ -226,7 +227,7 @@ class GitHubActionsTestCase(base.AsyncTestCase):
 
         with (
             mock.patch(
-                'imbi_automations.actions.github.clients.GitHub',
+                'imbi_automations.actions.github.clients.GitHub.get_instance',
                 return_value=mock_github_client,
             ),
             self.assertRaises(RuntimeError) as ctx,
@@ -258,7 +259,7 @@ class GitHubActionsTestCase(base.AsyncTestCase):
 
         with (
             mock.patch(
-                'imbi_automations.actions.github.clients.GitHub',
+                'imbi_automations.actions.github.clients.GitHub.get_instance',
                 return_value=mock_github_client,
             ),
             self.assertRaises(RuntimeError) as ctx,
@@ -290,7 +291,7 @@ class GitHubActionsTestCase(base.AsyncTestCase):
         ]
 
         with mock.patch(
-            'imbi_automations.actions.github.clients.GitHub',
+            'imbi_automations.actions.github.clients.GitHub.get_instance',
             return_value=mock_github_client,
         ):
             await self.github_actions.execute(action)
@@ -329,7 +330,7 @@ class GitHubActionsTestCase(base.AsyncTestCase):
 
         with (
             mock.patch(
-                'imbi_automations.actions.github.clients.GitHub',
+                'imbi_automations.actions.github.clients.GitHub.get_instance',
                 return_value=mock_github_client,
             ),
             self.assertRaises(RuntimeError) as ctx,
@@ -338,6 +339,53 @@ class GitHubActionsTestCase(base.AsyncTestCase):
 
         self.assertIn('Environment sync failed', str(ctx.exception))
 
+    async def test_sync_project_environments_runs_concurrently(self) -> None:
+        """Test deletes and creates are in flight at the same time."""
+        created = asyncio.Event()
+        mock_github_client = mock.AsyncMock()
+        mock_github_client.get_repository_environments.return_value = [
+            models.GitHubEnvironment(
+                id=1, name='old-env', created_at='2024-01-01T00:00:00Z'
+            ),
+            models.GitHubEnvironment(
+                id=2, name='stale-env', created_at='2024-01-01T00:00:00Z'
+            ),
+        ]
+
+        async def delete_environment(org: str, repo: str, name: str) -> bool:
+            # Only completes if the create was issued without waiting
+            await asyncio.wait_for(created.wait(), timeout=1)
+            if name == 'stale-env':
+                raise httpx.HTTPError('Delete failed')
+            return True
+
+        async def create_environment(
+            org: str, repo: str, name: str
+        ) -> models.GitHubEnvironment:
+            created.set()
+            return models.GitHubEnvironment(
+                id=3, name=name, created_at='2024-01-01T00:00:00Z'
+            )
+
+        mock_github_client.delete_environment.side_effect = delete_environment
+        mock_github_client.create_environment.side_effect = create_environment
+
+        result = await self.github_actions._sync_project_environments(
+            org='test-org',
+            repo='test-repo',
+            imbi_environments=['development'],
+            github_client=mock_github_client,
+        )
+
+        self.assertFalse(result['success'])
+        self.assertEqual(result['created'], ['development'])
+        self.assertEqual(result['deleted'], ['old-env'])
+        self.assertEqual(
+            result['errors'],
+            ['Failed to delete environment "stale-env": Delete failed'],
+        )
+        self.assertEqual(result['total_operations'], 3)
+
     async def test_sync_environments_empty_imbi_list(self) -> None:
         """Test sync with empty environments list deletes all GitHub envs."""
         # Create project with empty list (not None)
@@ -385,7 +433,7 @@ class GitHubActionsTestCase(base.AsyncTestCase):
         ]
 
         with mock.patch(
-            'imbi_automations.actions.github.clients.GitHub',
+            'imbi_automations.actions.github.clients.GitHub.get_instance',
             return_value=mock_github_client,
         ):
             await github_actions_empty.execute(action)
@@ -447,7 +495,7 @@ class GitHubActionsTestCase(base.AsyncTestCase):
         mock_github_client.get_repository_environments.return_value = []
 
         with mock.patch(
-            'imbi_automations.actions.github.clients.GitHub',
+            'imbi_automations.actions.github.clients.GitHub.get_instance',
             return_value=mock_github_client,
         ):
             await github_actions_unsorted.execute(action)
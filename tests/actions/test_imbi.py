@@ -92,6 +92,24 @@ class ImbiActionsTestCase(base.AsyncTestCase):
             value='Python 3.12',
         )
 
+    @mock.patch('imbi_automations.clients.Imbi.get_instance')
+    async def test_set_project_fact_unchanged_does_not_log_update(
+        self, mock_get_instance: mock.MagicMock
+    ) -> None:
+        client = mock.AsyncMock()
+        client.set_project_attribute.return_value = False
+        mock_get_instance.return_value = client
+        action = models.WorkflowImbiAction(
+            name='set-fact',
+            type='imbi',
+            command='set_project_fact',
+            attribute_name='programming_language',
+            value='Python 3.12',
+        )
+        with self.assertNoLogs(level='INFO'):
+            await self.imbi_executor.execute(action)
+        client.set_project_attribute.assert_awaited_once()
+
     @mock.patch('imbi_automations.clients.Imbi.get_instance')
     async def test_set_project_fact_http_error_propagates(
         self, mock_get_instance: mock.MagicMock
@@ -1,8 +1,10 @@
 """Comprehensive tests for the claude module."""
 
+import asyncio
 import json
 import pathlib
 import tempfile
+import typing
 import unittest
 from unittest import mock
 
@@ -411,6 +413,55 @@ class AgentPlanTestCase(unittest.TestCase):
         self.assertEqual(plan.plan, [])
 
 
+class CircuitBreakerTestCase(unittest.TestCase):
+    """Test cases for the Claude Code circuit breaker."""
+
+    def setUp(self) -> None:
+        self.breaker = claude.CircuitBreaker(
+            failure_threshold=2, recovery_seconds=30
+        )
+
+    def test_opens_after_threshold(self) -> None:
+        """Test the circuit opens after consecutive failures."""
+        self.breaker.before_call()
+        self.breaker.record_failure()
+        self.assertFalse(self.breaker.is_open)
+        self.breaker.before_call()
+        self.breaker.record_failure()
+        self.assertTrue(self.breaker.is_open)
+        with self.assertRaises(claude.CircuitOpenError):
+            self.breaker.before_call()
+
+    def test_success_resets_failures(self) -> None:
+        """Test a success clears the consecutive failure count."""
+        self.breaker.record_failure()
+        self.breaker.record_success()
+        self.breaker.record_failure()
+        self.assertFalse(self.breaker.is_open)
+
+    def test_half_open_allows_single_trial(self) -> None:
+        """Test one trial query is allowed after the recovery period."""
+        self.breaker.record_failure()
+        self.breaker.record_failure()
+        with mock.patch('time.monotonic', return_value=10**9):
+            self.breaker.before_call()
+            with self.assertRaises(claude.CircuitOpenError):
+                self.breaker.before_call()
+            self.breaker.record_failure()
+            with self.assertRaises(claude.CircuitOpenError):
+                self.breaker.before_call()
+
+    def test_half_open_trial_success_closes(self) -> None:
+        """Test a successful trial query closes the circuit."""
+        self.breaker.record_failure()
+        self.breaker.record_failure()
+        with mock.patch('time.monotonic', return_value=10**9):
+            self.breaker.before_call()
+        self.breaker.record_success()
+        self.assertFalse(self.breaker.is_open)
+        self.breaker.before_call()
+
+
 class ClaudeTestCase(base.AsyncTestCase):
     """Test cases for the Claude class."""
 
@@ -462,10 +513,23 @@ class ClaudeTestCase(base.AsyncTestCase):
             ),
             working_directory=self.working_directory,
         )
+        claude.CircuitBreaker._instance = None
+        with (
+            mock.patch('claude_agent_sdk.ClaudeSDKClient'),
+            mock.patch(
+                'builtins.open',
+                new_callable=mock.mock_open,
+                read_data='Mock system prompt',
+            ),
+        ):
+            self.claude_instance = claude.Claude(
+                config=self.config, context=self.context
+            )
 
     def tearDown(self) -> None:
         super().tearDown()
         self.temp_dir.cleanup()
+        claude.CircuitBreaker._instance = None
 
     @mock.patch('claude_agent_sdk.ClaudeSDKClient')
     @mock.patch(
@@ -497,6 +561,215 @@ class ClaudeTestCase(base.AsyncTestCase):
         self.assertIsNone(claude_instance._client)
         mock_client_class.assert_not_called()
 
+    async def test_agent_query_retries_process_errors(self) -> None:
+        """Test agent_query retries transient Claude Code failures."""
+        response = models.ClaudeAgentResponse(message='done')
+        with (
+            mock.patch.object(
+                self.claude_instance,
+                '_execute_sdk_query',
+                side_effect=[
+                    claude_agent_sdk.ProcessError('boom', exit_code=1),
+                    claude_agent_sdk.CLIConnectionError('lost'),
+                    response,
+                ],
+            ) as execute,
+            mock.patch('asyncio.sleep') as sleep,
+        ):
+            result = await self.claude_instance.agent_query('prompt')
+
+        self.assertIs(result, response)
+        self.assertEqual(execute.call_count, 3)
+        self.assertEqual(sleep.call_count, 2)
+
+    async def test_agent_query_does_not_retry_missing_cli(self) -> None:
+        """Test agent_query fails fast when the CLI is not installed."""
+        with (
+            mock.patch.object(
+                self.claude_instance,
+                '_execute_sdk_query',
+                side_effect=claude_agent_sdk.CLINotFoundError(),
+            ) as execute,
+            self.assertRaises(claude_agent_sdk.CLINotFoundError),
+        ):
+            await self.claude_instance.agent_query('prompt')
+
+        execute.assert_called_once()
+
+    async def test_agent_query_short_circuits_when_open(self) -> None:
+        """Test agent_query fails fast while the circuit is open."""
+        with mock.patch.object(
+            self.claude_instance,
+            '_execute_sdk_query_with_retry',
+            side_effect=claude_agent_sdk.CLIConnectionError('down'),
+        ) as execute:
+            threshold = self.claude_instance.circuit_breaker.failure_threshold
+            for _attempt in range(threshold):
+                with self.assertRaises(claude_agent_sdk.CLIConnectionError):
+                    await self.claude_instance.agent_query('prompt')
+            with self.assertRaises(claude.CircuitOpenError):
+                await self.claude_instance.agent_query('prompt')
+
+        self.assertEqual(execute.call_count, threshold)
+
+    async def test_agent_query_timeouts_do_not_open_circuit(self) -> None:
+        """Test action timeouts are not counted as upstream failures."""
+
+        async def slow_query(prompt: str) -> models.ClaudeAgentResponse:
+            await asyncio.sleep(1)
+            return models.ClaudeAgentResponse(message='done')
+
+        with mock.patch.object(
+            self.claude_instance,
+            '_execute_sdk_query_with_retry',
+            side_effect=slow_query,
+        ):
+            threshold = self.claude_instance.circuit_breaker.failure_threshold
+            for _attempt in range(threshold):
+                with self.assertRaises(TimeoutError):
+                    await self.claude_instance.agent_query(
+                        'prompt', timeout='0s'
+                    )
+
+        self.assertFalse(self.claude_instance.circuit_breaker.is_open)
+
+    def test_circuit_settings_come_from_configuration(self) -> None:
+        """Test the shared circuit breaker uses the [claude] settings."""
+        claude.CircuitBreaker._instance = None  # setUp already built one
+        self.config.claude.circuit_failure_threshold = 2
+        self.config.claude.circuit_recovery_seconds = 5.0
+
+        with mock.patch('claude_agent_sdk.ClaudeSDKClient'):
+            first = claude.Claude(config=self.config, context=self.context)
+
+        other_config = self.config.model_copy(deep=True)
+        other_config.claude.circuit_failure_threshold = 9
+        with mock.patch('claude_agent_sdk.ClaudeSDKClient'):
+            second = claude.Claude(config=other_config, context=self.context)
+
+        self.assertIs(first.circuit_breaker, second.circuit_breaker)
+        self.assertEqual(first.circuit_breaker.failure_threshold, 2)
+        self.assertEqual(first.circuit_breaker.recovery_seconds, 5.0)
+
+    def _make_sdk_client(
+        self, claude_instance: claude.Claude
+    ) -> mock.MagicMock:
+        """Return a fake SDK client that submits a response when queried."""
+        client = mock.MagicMock()
+        client.connect = mock.AsyncMock()
+        client.query = mock.AsyncMock()
+        client.disconnect = mock.AsyncMock()
+
+        async def receive_response() -> typing.AsyncIterator[None]:
+            claude_instance._submitted_response = models.ClaudeAgentResponse(
+                message='done'
+            )
+            return
+            yield
+
+        client.receive_response = receive_response
+        return client
+
+    async def test_agent_query_disconnects_client_that_failed(self) -> None:
+        """Test a failed connect cleans up its own client on retry."""
+        first = self._make_sdk_client(self.claude_instance)
+        failing = self._make_sdk_client(self.claude_instance)
+        failing.connect.side_effect = claude_agent_sdk.CLIConnectionError(
+            'lost'
+        )
+        third = self._make_sdk_client(self.claude_instance)
+        with (
+            mock.patch.object(
+                self.claude_instance,
+                '_create_client',
+                side_effect=[first, failing, third],
+            ),
+            mock.patch('asyncio.sleep'),
+        ):
+            await self.claude_instance.agent_query('one')
+            await self.claude_instance.agent_query('two')
+
+        failing.disconnect.assert_awaited_once()
+        failing.query.assert_not_awaited()
+        first.disconnect.assert_awaited_once()
+        third.query.assert_awaited_once_with('two')
+
+    def test_agent_tools_server_created_once(self) -> None:
+        """Test every connection shares one agent_tools MCP server."""
+        with mock.patch(
+            'claude_agent_sdk.create_sdk_mcp_server'
+        ) as create_server:
+            first = self.claude_instance._get_agent_tools()
+            second = self.claude_instance._get_agent_tools()
+
+        self.assertIs(first, second)
+        create_server.assert_called_once()
+
+    async def test_anthropic_client_shared_until_closed(self) -> None:
+        """Test one Anthropic API client is reused until it is closed."""
+        self.addAsyncCleanup(claude.close_anthropic_client)
+        first = claude._anthropic_client(self.config.anthropic)
+        self.assertIs(claude._anthropic_client(self.config.anthropic), first)
+
+        with mock.patch.object(first, 'close') as close:
+            await claude.close_anthropic_client()
+
+        close.assert_awaited_once()
+        self.assertIsNot(
+            claude._anthropic_client(self.config.anthropic), first
+        )
+
+    def test_command_files_keep_names_ending_in_j2_characters(self) -> None:
+        """Test only the .j2 suffix is removed from command file names."""
+        source_dir = self.working_directory / 'commands-source'
+        source_dir.mkdir()
+        template = source_dir / 'deploy2.md.j2'
+        template.write_text('Deploy {{ workflow_name }}', encoding='utf-8')
+        plain = source_dir / 'fix.j'
+        plain.write_text('Fix it', encoding='utf-8')
+
+        with (
+            mock.patch('claude_agent_sdk.ClaudeSDKClient'),
+            mock.patch.object(
+                claude, '_command_files', return_value=(template, plain)
+            ),
+        ):
+            claude.Claude(config=self.config, context=self.context)
+
+        commands_dir = self.working_directory / '.claude' / 'commands'
+        self.assertEqual(
+            (commands_dir / 'deploy2.md').read_text(encoding='utf-8'),
+            'Deploy test-workflow',
+        )
+        self.assertEqual(
+            (commands_dir / 'fix.j').read_text(encoding='utf-8'), 'Fix it'
+        )
+
+    def test_settings_include_git_signing_config(self) -> None:
+        """Test signing options are grouped into the git settings."""
+        self.config.git.gpg_sign = True
+        self.config.git.gpg_format = 'ssh'
+        self.config.git.signing_key = 'key'
+        self.config.git.ssh_program = '/usr/bin/op-ssh-sign'
+
+        with mock.patch('claude_agent_sdk.ClaudeSDKClient'):
+            claude.Claude(config=self.config, context=self.context)
+
+        settings = json.loads(
+            (self.working_directory / '.claude' / 'settings.json').read_text()
+        )
+        self.assertEqual(
+            settings['git'],
+            {
+                'commit': {'gpgsign': True},
+                'user': {'signingkey': 'key'},
+                'gpg': {
+                    'format': 'ssh',
+                    'ssh': {'program': '/usr/bin/op-ssh-sign'},
+                },
+            },
+        )
+
     # Note: Removed obsolete _parse_message tests that tested return values.
     # The _parse_message method was refactored to return None and work via
     # side effects.
@@ -590,7 +863,12 @@ class ClaudeTestCase(base.AsyncTestCase):
 
         content = [text_block1, text_block2, tool_block]
 
-        with mock.patch.object(claude_instance.logger, 'debug') as mock_debug:
+        with (
+            mock.patch.object(
+                claude_instance.logger, 'isEnabledFor', return_value=True
+            ),
+            mock.patch.object(claude_instance.logger, 'debug') as mock_debug,
+        ):
             claude_instance._log_message('Test Type', content)
 
         # Verify only text blocks were logged
@@ -651,7 +929,12 @@ class ClaudeTestCase(base.AsyncTestCase):
         )
         content = [thinking_block]
 
-        with mock.patch.object(claude_instance.logger, 'debug') as mock_debug:
+        with (
+            mock.patch.object(
+                claude_instance.logger, 'isEnabledFor', return_value=True
+            ),
+            mock.patch.object(claude_instance.logger, 'debug') as mock_debug,
+        ):
             claude_instance._log_message('Test Type', content)
 
         mock_debug.assert_called_once_with(
@@ -682,7 +965,12 @@ class ClaudeTestCase(base.AsyncTestCase):
         )
         content = [thinking_block]
 
-        with mock.patch.object(claude_instance.logger, 'debug') as mock_debug:
+        with (
+            mock.patch.object(
+                claude_instance.logger, 'isEnabledFor', return_value=True
+            ),
+            mock.patch.object(claude_instance.logger, 'debug') as mock_debug,
+        ):
             claude_instance._log_message('Test Type', content)
 
         # Should be truncated to 100 chars + '...'
@@ -693,6 +981,22 @@ class ClaudeTestCase(base.AsyncTestCase):
             'a' * 100 + '...',
         )
 
+    def test_log_message_skips_blocks_when_debug_disabled(self) -> None:
+        """Test message text is not formatted when debug is disabled."""
+        content = [claude_agent_sdk.TextBlock(text='Some message:')]
+
+        with (
+            mock.patch.object(
+                self.claude_instance.logger, 'isEnabledFor', return_value=False
+            ),
+            mock.patch.object(
+                self.claude_instance.logger, 'debug'
+            ) as mock_debug,
+        ):
+            self.claude_instance._log_message('Test Type', content)
+
+        mock_debug.assert_not_called()
+
     def test_log_message_with_unknown_block_type(self) -> None:
         """Test _log_message method with unknown block type."""
         with (
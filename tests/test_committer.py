@@ -351,6 +351,29 @@ class ClaudeCommitTestCase(base.AsyncTestCase):
 
         self.assertFalse(result)
 
+    @mock.patch('imbi_automations.committer.prompts.render')
+    @mock.patch('imbi_automations.committer.claude.Claude')
+    async def test_reuses_context_claude_client(
+        self, mock_claude_class: mock.MagicMock, mock_render: mock.MagicMock
+    ) -> None:
+        """Test commits share the Claude client of the context."""
+        mock_client = mock.MagicMock()
+        mock_claude_class.return_value = mock_client
+        mock_client.context = self.context
+        mock_client.configuration = self.config
+        mock_client.prompt_kwargs = {}
+        mock_client.agent_query = mock.AsyncMock(
+            return_value=models.ClaudeAgentResponse(message='Done')
+        )
+        mock_render.return_value = 'Commit the changes'
+
+        c = committer.Committer(self.config, verbose=False)
+        await c._claude_commit(self.context, self.action)
+        await c._claude_commit(self.context, self.action)
+
+        mock_claude_class.assert_called_once()
+        self.assertEqual(mock_client.agent_query.await_count, 2)
+
     # test_passes_correct_response_model removed - agent_query no longer
     # takes response_model parameter with unified ClaudeAgentResponse
 
@@ -128,6 +128,16 @@ class ImbiMetadataCacheTestCase(base.AsyncTestCase):
         result = self.cache.translate_environments(['Production', 'staging'])
         self.assertEqual(result, ['production', 'staging'])
 
+    def test_translate_environments_rebuilds_index_on_refresh(self) -> None:
+        self.cache.cache_data.environments = self.environments
+        self.assertEqual(
+            self.cache.translate_environments(['Production']), ['production']
+        )
+        self.cache.cache_data.environments = [_env('Production', 'prod')]
+        self.assertEqual(
+            self.cache.translate_environments(['Production']), ['prod']
+        )
+
     def test_translate_environments_not_found(self) -> None:
         self.cache.cache_data.environments = self.environments
         with self.assertRaises(ValueError) as ctx:
@@ -309,3 +309,12 @@ class ExpandMcpConfigTestCase(unittest.TestCase):
         result = claude._expand_mcp_config(config)
         self.assertEqual(result['some_number'], 42)
         self.assertEqual(result['some_bool'], True)
+
+    def test_config_without_variables_is_returned_as_is(self) -> None:
+        """Test a config with no variable references is not copied."""
+        config = {
+            'type': 'http',
+            'url': 'https://example.com/mcp',
+            'headers': {'Accept': 'application/json'},
+        }
+        self.assertIs(claude._expand_mcp_config(config), config)
@@ -175,6 +175,26 @@ class RenderTestCase(PromptsTestBase):
         result = prompts.render(template='Static template')
         self.assertEqual(result, 'Static template')
 
+    def test_render_reuses_compiled_template(self) -> None:
+        """Test rendering the same source twice compiles it once."""
+        template = 'Cached {{ custom_var }} {{ workflow.configuration.name }}'
+        prompts._compile.cache_clear()
+        first = prompts.render(self.context, template=template, custom_var=1)
+        second = prompts.render(self.context, template=template, custom_var=2)
+        self.assertEqual(first, 'Cached 1 test-workflow')
+        self.assertEqual(second, 'Cached 2 test-workflow')
+        cache_info = prompts._compile.cache_info()
+        self.assertEqual(cache_info.misses, 1)
+        self.assertEqual(cache_info.hits, 1)
+
+    def test_render_source_path_picks_up_changes(self) -> None:
+        """Test edits to a source file are reflected on the next render."""
+        template_file = self.working_dir / 'template.txt'
+        template_file.write_text('First', encoding='utf-8')
+        self.assertEqual(prompts.render(source=template_file), 'First')
+        template_file.write_text('Second', encoding='utf-8')
+        self.assertEqual(prompts.render(source=template_file), 'Second')
+
     def test_render_with_anyurl_source(self) -> None:
         """Test render with AnyUrl source."""
         # Create a template file
@@ -340,6 +360,13 @@ class CompareSemverTestCase(unittest.TestCase):
         self.assertEqual(result['current_minor'], 9)
         self.assertEqual(result['target_minor'], 10)
 
+    def test_compare_semver_with_prerelease(self) -> None:
+        """Test non-numeric versions still use semver's parser."""
+        result = prompts.compare_semver('1.2.3-beta', '1.2.3')
+
+        self.assertTrue(result['is_older'])
+        self.assertIsNone(result['current_build'])
+
     def test_compare_semver_strips_prefixes(self) -> None:
         """Test compare_semver strips version prefixes."""
         result = prompts.compare_semver('^18.2.0', '^19.0.0')
@@ -365,6 +392,15 @@ class CompareSemverTestCase(unittest.TestCase):
         self.assertEqual(result['target_minor'], 3)
         self.assertEqual(result['target_patch'], 5)
 
+    def test_compare_semver_reuses_parsed_versions(self) -> None:
+        """Test repeated comparisons parse each version string once."""
+        prompts._parse_version_with_build.cache_clear()
+        prompts.compare_semver('3.9.18-3', '3.9.18-4')
+        prompts.compare_semver('3.9.18-3', '3.9.18-4')
+        cache_info = prompts._parse_version_with_build.cache_info()
+        self.assertEqual(cache_info.misses, 2)
+        self.assertEqual(cache_info.hits, 2)
+
 
 class GetComponentVersionTestCase(PromptsTestBase):
     """Tests for get_component_version template function."""